@@ -6,10 +6,15 @@ Based on RestaurantListAgent.md specification.
 """
 
 import os
-from typing import TypedDict, List, Optional, Dict, Any
+import re
+import string
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from typing import TypedDict, List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from langgraph.graph import StateGraph, END
 from openai import OpenAI
@@ -17,12 +22,15 @@ from dotenv import load_dotenv
 
 from models.restaurant import Restaurant, create_restaurant
 from clients.google_sheets_client import GoogleSheetsClient
-from utils.config import get_known_urls, get_search_queries, get_source_domains, get_deep_crawl_sources
-from utils.cache import get_cached, set_cached, is_cache_enabled
+from clients.tavily_client import RateLimitedTavilyClient
+from utils.config import Config, get_known_urls, get_search_queries, get_source_domains, get_deep_crawl_sources
+from utils.cache import get_cached, set_cached, is_cache_enabled, get_cache_key
+from utils.logger import setup_logger
 from prompts import (
     restaurant_extraction_prompt,
     price_enrichment_prompt,
     priority_reasons_prompt,
+    priority_reasons_batch_prompt,
     edit_command_prompt,
 )
 from prompts.extraction import RESTAURANT_EXTRACTION_SYSTEM, PRICE_ENRICHMENT_SYSTEM
@@ -32,6 +40,8 @@ from prompts.editing import EDIT_COMMAND_SYSTEM
 # Load environment variables
 load_dotenv()
 
+logger = setup_logger(__name__)
+
 
 # ============================================================================
 # State Schema (Section 2.2)
@@ -50,6 +60,7 @@ class RestaurantListState(TypedDict):
 
     # Current state
     current_list: List[Restaurant]
+    current_name_index: Dict[str, int]  # normalized name -> index in current_list
 
     # Comparison results
     restaurants_to_add: List[Restaurant]
@@ -75,7 +86,46 @@ class RestaurantListState(TypedDict):
 # Valid price range values
 VALID_PRICE_RANGES = {'$', '$$', '$$$', '$$$$'}
 
+# Source-specific rank fields on Restaurant
+_RANK_FIELDS = (
+    'eater_dc_rank',
+    'michelin_guide_rank',
+    'washington_post_rank',
+    'washingtonian_rank',
+    'infatuation_rank',
+)
+
+# Display names for the rank fields, in the same order
+_RANK_FIELD_DISPLAY_NAMES = (
+    ('eater_dc_rank', 'Eater DC'),
+    ('michelin_guide_rank', 'Michelin Guide'),
+    ('washington_post_rank', 'Washington Post'),
+    ('washingtonian_rank', 'Washingtonian'),
+    ('infatuation_rank', 'Infatuation'),
+)
+
+# String fields merged from duplicates: (field, prefer longer value)
+_MERGE_STRING_FIELDS = (
+    ('description', True),
+    ('price_range', False),
+    ('cuisine_type', False),
+    ('booking_website', False),
+)
 
+# Runs of 1-4 dollar signs inside a price string
+_PRICE_RE = re.compile(r'\${1,4}')
+
+# Price-tier keywords for word descriptions, checked most expensive first.
+# The leading \b keeps "inexpensive" from matching "expensive".
+_PRICE_WORD_TIERS = (
+    (re.compile(r'\b(?:very expensive|fine dining|splurge|luxury)'), '$$$$'),
+    (re.compile(r'\b(?:expensive|upscale|pricey)'), '$$$'),
+    (re.compile(r'\b(?:moderate|mid-range|reasonable)'), '$$'),
+    (re.compile(r'\b(?:cheap|budget|inexpensive|affordable)'), '$'),
+)
+
+
+@lru_cache(maxsize=512)
 def normalize_price_range(price: str) -> str:
     """
     Normalize and validate price range values.
@@ -98,126 +148,452 @@ def normalize_price_range(price: str) -> str:
     if price in VALID_PRICE_RANGES:
         return price
 
-    # Handle ranges like "$$$-$$$$" or "$$$ - $$$$" - take the higher value
-    if '-' in price or '–' in price:  # Handle both hyphen and en-dash
-        # Extract all $ sequences
-        import re
-        matches = re.findall(r'\${1,4}', price)
-        if matches:
-            # Return the longest (most expensive) one
-            return max(matches, key=len)
-
-    # Handle "to" ranges like "$$$ to $$$$"
-    if ' to ' in price.lower():
-        import re
-        matches = re.findall(r'\${1,4}', price)
-        if matches:
-            return max(matches, key=len)
-
-    # Extract any valid price pattern from the string
-    import re
-    matches = re.findall(r'\${1,4}', price)
-    if matches:
-        # If multiple found, prefer the most common or longest
-        return max(matches, key=len)
+    # Extract any valid price pattern from the string. Ranges like "$$$-$$$$",
+    # "$$$ – $$$$" or "$$$ to $$$$" take the higher (longest) value.
+    # Inputs without a "$" (numbers, words) skip the regex entirely.
+    if '$' in price:
+        return max(_PRICE_RE.findall(price), key=len)
 
     # Handle word descriptions
     price_lower = price.lower()
-    if any(word in price_lower for word in ['very expensive', 'fine dining', 'splurge', 'luxury']):
-        return '$$$$'
-    if any(word in price_lower for word in ['expensive', 'upscale', 'pricey']):
-        return '$$$'
-    if any(word in price_lower for word in ['moderate', 'mid-range', 'reasonable']):
-        return '$$'
-    if any(word in price_lower for word in ['cheap', 'budget', 'inexpensive', 'affordable']):
-        return '$'
+    for pattern, tier in _PRICE_WORD_TIERS:
+        if pattern.search(price_lower):
+            return tier
 
     # Unknown format
     return ''
 
 
+# Output-token caps. A cap is only sent where the response has to stay small
+# (batched JSON answers); extraction and single free-text answers are left
+# uncapped so a long restaurant list is never cut off mid-JSON. Batched calls
+# budget per item plus fixed overhead for the JSON wrapper; a price entry like
+# {"id": 12, "price_range": "$$$"} costs 12-17 tokens, more when pretty-printed.
+LLM_JSON_BATCH_OVERHEAD_TOKENS = 64
+PRICE_ENRICHMENT_TOKENS_PER_ITEM = 30
+PRIORITY_REASONS_TOKENS_PER_ITEM = 256
+
+# OpenAI model used for all LLM calls (read once at import)
+OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+
+# Reasoning models reject max_tokens and take max_completion_tokens instead,
+# which also counts their hidden reasoning tokens, so they get extra headroom
+REASONING_MODEL_PREFIXES = ('o1', 'o3', 'o4', 'gpt-5')
+LLM_REASONING_TOKEN_ALLOWANCE = int(os.getenv('LLM_REASONING_TOKEN_ALLOWANCE', '4096'))
+
+# Minimum extracted page length (chars) treated as a successful Tavily extract
+MIN_USEFUL_CONTENT_LEN = 500
+
+# Max concurrent OpenAI requests per fan-out. LLM calls spend nearly all their
+# time waiting on the network, so this is set well above the Tavily pools.
+LLM_MAX_WORKERS = int(os.getenv('LLM_MAX_WORKERS', '16'))
+
+# Stop queuing further source-specific queries once this many unique
+# restaurants have been found (0 disables early termination)
+SOURCE_SEARCH_TARGET_UNIQUE = int(os.getenv('SOURCE_SEARCH_TARGET_UNIQUE', '0'))
+
+# Max restaurants per batched price-enrichment LLM call
+PRICE_ENRICHMENT_BATCH_SIZE = 20
+
+# Max restaurants per batched priority-reasons LLM call
+PRIORITY_REASONS_BATCH_SIZE = 10
+
+# Estimated prompt-token budget for the per-restaurant sections of one batched
+# price-enrichment call (excludes the shared instructions and response)
+PRICE_ENRICHMENT_PROMPT_TOKEN_BUDGET = 24000
+
+# Max search content per restaurant included in the price-enrichment prompt
+PRICE_ENRICHMENT_CONTENT_CHARS = 4000
+
+
+def llm_token_limit(max_output_tokens: int) -> Dict[str, int]:
+    """
+    Build the output-token cap argument for chat.completions.create.
+
+    Args:
+        max_output_tokens: Max tokens of visible output to allow
+
+    Returns:
+        {'max_completion_tokens': ...} for reasoning models (with the reasoning
+        allowance added), {'max_tokens': ...} otherwise
+    """
+    if OPENAI_MODEL.startswith(REASONING_MODEL_PREFIXES):
+        return {'max_completion_tokens': max_output_tokens + LLM_REASONING_TOKEN_ALLOWANCE}
+    return {'max_tokens': max_output_tokens}
+
+
+def _stream_json(client: OpenAI, **create_kwargs) -> str:
+    """
+    Stream a JSON-mode chat completion and stop once the top-level object closes.
+
+    The model can keep emitting whitespace after the closing brace until it
+    hits its token limit; closing the stream as soon as brace depth returns to zero
+    avoids waiting on (and paying for) that tail.
+
+    Args:
+        client: OpenAI client
+        **create_kwargs: Arguments for client.chat.completions.create
+            (should include response_format={"type": "json_object"})
+
+    Returns:
+        Raw JSON text of the top-level object
+    """
+    stream = client.chat.completions.create(stream=True, **create_kwargs)
+    parts = []
+    depth = 0
+    started = False
+    in_string = False
+    escaped = False
+
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+
+            for i, ch in enumerate(delta):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == '\\':
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch == '{':
+                    depth += 1
+                    started = True
+                elif ch == '}':
+                    depth -= 1
+                    if started and depth == 0:
+                        parts.append(delta[:i + 1])
+                        return ''.join(parts)
+            parts.append(delta)
+    finally:
+        stream.close()
+
+    return ''.join(parts)
+
+
+# Shared OpenAI client (one HTTP connection pool per process)
+_openai_client: Optional[OpenAI] = None
+
+
+def get_openai_client() -> OpenAI:
+    """
+    Get the shared OpenAI client, creating it on first use.
+
+    The client is thread-safe, and reusing it keeps connections alive across
+    the many parallel LLM calls instead of setting up a new pool per call.
+
+    Returns:
+        OpenAI client
+    """
+    global _openai_client
+
+    if _openai_client is None:
+        _openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+    return _openai_client
+
+
+# Shared Tavily client (one connection pool and rate limit per process)
+_tavily_client: Optional[RateLimitedTavilyClient] = None
+
+
+def get_tavily_client() -> RateLimitedTavilyClient:
+    """
+    Get the shared rate-limited Tavily client, creating it on first use.
+
+    Sharing one client keeps Tavily connections alive across discovery and
+    price enrichment, and makes every node draw from the same rate limit.
+
+    Returns:
+        RateLimitedTavilyClient using TAVILY_API_KEY
+    """
+    global _tavily_client
+
+    if _tavily_client is None:
+        _tavily_client = RateLimitedTavilyClient(api_key=Config.TAVILY_API_KEY)
+
+    return _tavily_client
+
+
+# Shared Google Sheets client (authenticated once per process)
+_sheets_client: Optional[GoogleSheetsClient] = None
+
+
+def get_sheets_client() -> GoogleSheetsClient:
+    """
+    Get the shared GoogleSheetsClient, creating it on first use.
+
+    Reusing one client avoids re-reading the OAuth token and rebuilding the
+    Sheets service for every node that touches the list.
+
+    Returns:
+        Authenticated GoogleSheetsClient
+    """
+    global _sheets_client
+
+    if _sheets_client is None:
+        _sheets_client = GoogleSheetsClient()
+
+    return _sheets_client
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheaply estimate the token count of a prompt fragment.
+
+    Uses the ~4 characters per token rule of thumb for English text, which is
+    close enough for packing prompts under a budget without a tokenizer.
+
+    Args:
+        text: Prompt fragment
+
+    Returns:
+        Estimated token count
+    """
+    return len(text) // 4 + 1
+
+
+def split_content_chunks(content: str, max_chars: int) -> List[str]:
+    """
+    Split content into chunks of at most max_chars, breaking on paragraph boundaries.
+
+    Paragraphs (separated by blank lines) are packed greedily so a restaurant's
+    write-up isn't cut mid-sentence across two LLM calls. Paragraphs longer
+    than max_chars are hard-split.
+
+    Args:
+        content: Text to split
+        max_chars: Max characters per chunk
+
+    Returns:
+        List of chunks (a single chunk if content already fits)
+    """
+    if len(content) <= max_chars:
+        return [content]
+
+    chunks = []
+    current = []
+    current_len = 0
+    for paragraph in content.split('\n\n'):
+        # Hard-split oversize paragraphs
+        pieces = [paragraph[i:i + max_chars] for i in range(0, len(paragraph), max_chars)] or ['']
+        for piece in pieces:
+            added_len = len(piece) + (2 if current else 0)
+            if current and current_len + added_len > max_chars:
+                chunks.append('\n\n'.join(current))
+                current = []
+                current_len = 0
+                added_len = len(piece)
+            current.append(piece)
+            current_len += added_len
+
+    if current:
+        chunks.append('\n\n'.join(current))
+
+    return chunks
+
+
+def _pack_prompts(
+    items: List[Any],
+    sizes: List[int],
+    token_budget: int,
+    max_items: int
+) -> List[List[Any]]:
+    """
+    Pack items into as few prompt batches as possible (first-fit decreasing).
+
+    Args:
+        items: Items to pack
+        sizes: Estimated token size of each item (same order as items)
+        token_budget: Max total estimated tokens per batch
+        max_items: Max items per batch (bounds the response size)
+
+    Returns:
+        List of batches; an item larger than the budget gets its own batch
+    """
+    batches: List[List[Any]] = []
+    batch_tokens: List[int] = []
+
+    for idx in sorted(range(len(items)), key=lambda i: sizes[i], reverse=True):
+        for b, batch in enumerate(batches):
+            if len(batch) < max_items and batch_tokens[b] + sizes[idx] <= token_budget:
+                batch.append(items[idx])
+                batch_tokens[b] += sizes[idx]
+                break
+        else:
+            batches.append([items[idx]])
+            batch_tokens.append(sizes[idx])
+
+    return batches
+
+
+@lru_cache(maxsize=None)
 def get_source_domain(source: str) -> str:
     """Map source names to their website domains from config."""
     return get_source_domains().get(source, "")
 
 
-def find_matching_restaurant_key(name: str, by_name: Dict[str, Restaurant]) -> Optional[str]:
+# Character-level transforms for name normalization, applied in one translate pass
+_NAME_PUNCT_TABLE = str.maketrans({
+    **{c: ' ' for c in string.punctuation},
+    "'": None,
+    '&': ' and ',
+})
+
+# Filler words ignored when comparing restaurant names
+_NAME_FILLER_RE = re.compile(r'\b(?:the|restaurant)\b')
+
+
+@lru_cache(maxsize=4096)
+def normalize_restaurant_name(name: str) -> str:
     """
-    Find if a restaurant name matches any existing entry using fuzzy matching.
+    Normalize a restaurant name for matching.
 
-    Uses rapidfuzz to detect similar names like:
-    - "Imperfecto" vs "Imperfecto: The Chef's Table"
-    - "Sushi Nakazawa" vs "Sushi Nakazawa Washington DC"
+    Case-folds, strips accents (so "Café" matches "Cafe"), drops apostrophes,
+    maps "&" to "and", turns other punctuation into spaces, removes filler
+    words ("the", "restaurant"), and collapses whitespace. Memoized so each
+    distinct name is normalized once per process, no matter how many
+    comparisons it takes part in.
 
     Args:
-        name: Restaurant name to check
-        by_name: Dict of existing restaurants keyed by lowercase name
+        name: Raw restaurant name
 
     Returns:
-        Matching key if found, None otherwise
+        Normalized name used as the dedup/comparison key
     """
-    name_lower = name.lower().strip()
+    folded = unicodedata.normalize('NFKD', name.casefold()).encode('ascii', 'ignore').decode()
+    folded = folded.translate(_NAME_PUNCT_TABLE)
+    stripped = ' '.join(_NAME_FILLER_RE.sub(' ', folded).split())
+    # Names made only of filler words (e.g. "The Restaurant") keep them
+    return stripped or ' '.join(folded.split())
 
-    # Exact match first (fastest)
-    if name_lower in by_name:
-        return name_lower
 
-    # Fuzzy match against all existing names
-    for existing_name in by_name.keys():
-        # Partial ratio catches substring matches
-        # e.g., "Imperfecto" in "Imperfecto: The Chef's Table" → 100
-        if fuzz.partial_ratio(name_lower, existing_name) >= 95:
-            return existing_name
+def build_name_index(restaurants: List[Restaurant]) -> Dict[str, int]:
+    """
+    Map each restaurant's normalized name to its position in the list.
 
-        # Token set ratio catches word reordering and extra words
-        # e.g., "Sushi Nakazawa" vs "Sushi Nakazawa Washington DC" → 100
-        if fuzz.token_set_ratio(name_lower, existing_name) >= 90:
-            return existing_name
+    Args:
+        restaurants: List of restaurants
 
-    return None
+    Returns:
+        Dict of normalized name -> list index
+    """
+    return {normalize_restaurant_name(r['name']): i for i, r in enumerate(restaurants)}
 
 
-def merge_restaurant_data(existing: Restaurant, new: Restaurant) -> None:
+def find_fuzzy_match(name_lower: str, choices: List[str]) -> Optional[str]:
     """
-    Merge data from a duplicate restaurant into the existing entry.
+    Find the best fuzzy match for a name among a list of normalized names.
 
-    Prefers non-empty values and longer descriptions.
+    Scores against all choices with rapidfuzz.process.extractOne, which keeps the
+    per-pair loop in native code and stops early via score_cutoff, instead of
+    calling the scorer once per candidate from Python.
 
     Args:
-        existing: The restaurant entry to update
-        new: The duplicate restaurant with potentially useful data
+        name_lower: Name normalized with normalize_restaurant_name
+        choices: Normalized names to compare against
+
+    Returns:
+        Matching choice if found, None otherwise
     """
-    # Merge string fields - prefer non-empty
-    if not existing['description'] and new['description']:
-        existing['description'] = new['description']
-    elif new['description'] and len(new['description']) > len(existing['description']):
-        # Prefer longer descriptions (more detail)
-        existing['description'] = new['description']
+    if not choices:
+        return None
 
-    if not existing['price_range'] and new['price_range']:
-        existing['price_range'] = new['price_range']
+    # Partial ratio catches substring matches
+    match = process.extractOne(
+        name_lower, choices, scorer=fuzz.partial_ratio, processor=None, score_cutoff=95
+    )
 
-    if not existing['cuisine_type'] and new['cuisine_type']:
-        existing['cuisine_type'] = new['cuisine_type']
+    # Token set ratio catches word reordering and extra words
+    if match is None:
+        match = process.extractOne(
+            name_lower, choices, scorer=fuzz.token_set_ratio, processor=None, score_cutoff=90
+        )
 
-    if not existing['booking_website'] and new['booking_website']:
-        existing['booking_website'] = new['booking_website']
+    return match[0] if match else None
 
-    # Merge source-specific rankings - take non-zero values
-    if new.get('eater_dc_rank', 0) > 0 and existing.get('eater_dc_rank', 0) == 0:
-        existing['eater_dc_rank'] = new['eater_dc_rank']
 
-    if new.get('michelin_guide_rank', 0) > 0 and existing.get('michelin_guide_rank', 0) == 0:
-        existing['michelin_guide_rank'] = new['michelin_guide_rank']
+def name_block_keys(name_lower: str) -> Set[str]:
+    """
+    Compute blocking keys for a restaurant name.
+
+    Each key is the 3-character prefix of a name token, so names that share no
+    word stems never get fuzzy-scored against each other. Because names are
+    accent-folded by normalize_restaurant_name, variants like "Cafe"/"Café"
+    still land in the same block.
 
-    if new.get('washington_post_rank', 0) > 0 and existing.get('washington_post_rank', 0) == 0:
-        existing['washington_post_rank'] = new['washington_post_rank']
+    Args:
+        name_lower: Name normalized with normalize_restaurant_name
+
+    Returns:
+        Set of blocking keys (empty if the name has no alphanumeric tokens)
+    """
+    return {token[:3] for token in re.findall(r'[a-z0-9]+', name_lower)}
+
+
+def build_name_blocks(names: List[str]) -> Dict[str, List[str]]:
+    """
+    Build a blocking index mapping each key from name_block_keys to its names.
+
+    Args:
+        names: Restaurant names normalized with normalize_restaurant_name
+
+    Returns:
+        Dict of blocking key -> names in that block
+    """
+    blocks: Dict[str, List[str]] = defaultdict(list)
+    for name in names:
+        for key in name_block_keys(name):
+            blocks[key].append(name)
+    return blocks
+
+
+def get_block_candidates(name_lower: str, blocks: Dict[str, List[str]]) -> List[str]:
+    """
+    Collect the names sharing at least one blocking key with name_lower.
+
+    Args:
+        name_lower: Name normalized with normalize_restaurant_name
+        blocks: Index built by build_name_blocks
+
+    Returns:
+        Candidate names, deduplicated, in first-seen order
+    """
+    candidates: Dict[str, None] = {}
+    for key in name_block_keys(name_lower):
+        for name in blocks.get(key, ()):
+            candidates[name] = None
+    return list(candidates)
 
-    if new.get('washingtonian_rank', 0) > 0 and existing.get('washingtonian_rank', 0) == 0:
-        existing['washingtonian_rank'] = new['washingtonian_rank']
 
-    if new.get('infatuation_rank', 0) > 0 and existing.get('infatuation_rank', 0) == 0:
-        existing['infatuation_rank'] = new['infatuation_rank']
+def merge_restaurant_data(existing: Restaurant, new: Restaurant) -> None:
+    """
+    Merge data from a duplicate restaurant into the existing entry.
+
+    Prefers non-empty values and longer descriptions.
+
+    Args:
+        existing: The restaurant entry to update
+        new: The duplicate restaurant with potentially useful data
+    """
+    # Merge string fields - prefer non-empty, and longer descriptions (more detail)
+    for field, prefer_longer in _MERGE_STRING_FIELDS:
+        new_value = new[field]
+        if new_value and (not existing[field] or (prefer_longer and len(new_value) > len(existing[field]))):
+            existing[field] = new_value
+
+    # Merge source-specific rankings - take non-zero values
+    for field in _RANK_FIELDS:
+        new_rank = new.get(field, 0)
+        if new_rank > 0 and existing.get(field, 0) == 0:
+            existing[field] = new_rank
 
 
 def deduplicate_restaurants(restaurants: List[Restaurant]) -> List[Restaurant]:
@@ -229,8 +605,12 @@ def deduplicate_restaurants(restaurants: List[Restaurant]) -> List[Restaurant]:
     - "Imperfecto" vs "Imperfecto: The Chef's Table"
     - "Sushi Nakazawa" vs "Sushi Nakazawa Washington DC"
 
-    When duplicates are found, data is merged, preferring non-empty values
-    and longer descriptions.
+    Each restaurant is compared only against the representatives kept so far
+    (narrowed with the blocking index) and merged into the single best match.
+    Clusters are deliberately not joined transitively: fuzzy matching isn't
+    transitive, so a short name like "Bar" matching both "Bar Chinois" and
+    "Bar Spero" must not collapse those two. When duplicates are found, data
+    is merged, preferring non-empty values and longer descriptions.
 
     Args:
         restaurants: List of restaurants potentially with duplicates
@@ -239,13 +619,21 @@ def deduplicate_restaurants(restaurants: List[Restaurant]) -> List[Restaurant]:
         Deduplicated list with merged data
     """
     by_name: Dict[str, Restaurant] = {}
+    blocks: Dict[str, List[str]] = defaultdict(list)
 
     for restaurant in restaurants:
-        match_key = find_matching_restaurant_key(restaurant['name'], by_name)
+        name_lower = normalize_restaurant_name(restaurant['name'])
+
+        # Exact match first (fastest), then fuzzy match against representatives
+        match_key = name_lower if name_lower in by_name else find_fuzzy_match(
+            name_lower, get_block_candidates(name_lower, blocks)
+        )
 
         if match_key is None:
-            # New restaurant - add it using lowercase name as key
-            by_name[restaurant['name'].lower().strip()] = restaurant
+            # New restaurant - it becomes the representative for its name
+            by_name[name_lower] = restaurant
+            for key in name_block_keys(name_lower):
+                blocks[key].append(name_lower)
         else:
             # Duplicate found - merge data
             merge_restaurant_data(by_name[match_key], restaurant)
@@ -276,14 +664,16 @@ def extract_known_urls(tavily_client, location: str) -> Dict[str, List[Restauran
 
     results_by_source = {}
 
-    # Collect all URLs with their source names
-    url_to_source = {}
-    all_urls = []
+    # Collect all URLs with their source names. A URL listed under several
+    # sources is fetched once and its content shared with each of them.
+    url_to_sources: Dict[str, List[str]] = {}
     known_urls = get_known_urls()
     for source, urls in known_urls.items():
         for url in urls:
-            url_to_source[url] = source
-            all_urls.append(url)
+            sources_for_url = url_to_sources.setdefault(url, [])
+            if source not in sources_for_url:
+                sources_for_url.append(source)
+    all_urls = list(url_to_sources)
 
     if not all_urls:
         return results_by_source
@@ -300,11 +690,9 @@ def extract_known_urls(tavily_client, location: str) -> Dict[str, List[Restauran
     for url in all_urls:
         cached_content = get_cached(url, 'extract')
         if cached_content:
-            source = url_to_source[url]
-            if source not in source_contents:
-                source_contents[source] = []
-            source_contents[source].append((url, cached_content))
-            print(f"    [cache] {source}: Using cached content for {url[:50]}...")
+            for source in url_to_sources[url]:
+                source_contents.setdefault(source, []).append((url, cached_content))
+                print(f"    [cache] {source}: Using cached content for {url[:50]}...")
         else:
             urls_to_fetch.append(url)
 
@@ -317,43 +705,35 @@ def extract_known_urls(tavily_client, location: str) -> Dict[str, List[Restauran
                 url = item.get('url', '')
                 raw_content = item.get('raw_content', '')
 
-                if not raw_content or url not in url_to_source:
+                if not raw_content or url not in url_to_sources:
                     continue
 
-                source = url_to_source[url]
-
                 # Cache the result
                 set_cached(url, raw_content, 'extract')
 
                 # Add to source contents for batched LLM processing
-                if source not in source_contents:
-                    source_contents[source] = []
-                source_contents[source].append((url, raw_content))
+                for source in url_to_sources[url]:
+                    source_contents.setdefault(source, []).append((url, raw_content))
 
-                # Mark as successful if we got content
-                if len(raw_content) >= 1000:
+                # Mark as successful if we got enough content
+                if len(raw_content) >= MIN_USEFUL_CONTENT_LEN:
                     successful_urls.add(url)
 
         except Exception as e:
             print(f"    ✗ Error with extract: {e}")
 
     # Strategy 2: Use Tavily crawl for URLs that yielded little/no content
-    urls_to_crawl = [url for url in all_urls if url not in successful_urls and url not in [u for contents in source_contents.values() for u, _ in contents]]
+    urls_with_content = {u for contents in source_contents.values() for u, _ in contents}
+    urls_to_crawl = [url for url in all_urls if url not in successful_urls and url not in urls_with_content]
 
     if urls_to_crawl:
         print(f"\n  Crawling {len(urls_to_crawl)} URLs for more complete extraction...")
 
-        for url in urls_to_crawl:
-            source = url_to_source[url]
-
-            # Check cache first
+        def crawl_single_url(url: str) -> tuple:
+            """Crawl one URL (cache first). Returns (url, content, from_cache)."""
             cached_content = get_cached(url, 'crawl')
             if cached_content:
-                if source not in source_contents:
-                    source_contents[source] = []
-                source_contents[source].append((url, cached_content))
-                print(f"    [cache] {source}: Using cached crawl for {url[:50]}...")
-                continue
+                return url, cached_content, True
 
             try:
                 crawl_result = tavily_client.crawl(
@@ -375,12 +755,23 @@ def extract_known_urls(tavily_client, location: str) -> Dict[str, List[Restauran
                     # Cache the result
                     set_cached(url, combined_content, 'crawl')
 
-                    if source not in source_contents:
-                        source_contents[source] = []
-                    source_contents[source].append((url, combined_content))
+                return url, combined_content, False
 
             except Exception as e:
                 print(f"    ✗ Error crawling {url}: {e}")
+                return url, '', False
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(crawl_single_url, url) for url in urls_to_crawl]
+
+            for future in as_completed(futures):
+                url, content, from_cache = future.result()
+                if not content:
+                    continue
+                for source in url_to_sources[url]:
+                    source_contents.setdefault(source, []).append((url, content))
+                    if from_cache:
+                        print(f"    [cache] {source}: Using cached crawl for {url[:50]}...")
 
     # Batch LLM calls by source and run in parallel
     # Combine all content from same source into single LLM call
@@ -408,7 +799,7 @@ def extract_known_urls(tavily_client, location: str) -> Dict[str, List[Restauran
     # Process sources in parallel
     print(f"\n  Processing {len(source_contents)} sources with LLM (parallel)...")
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
+    with ThreadPoolExecutor(max_workers=max(1, min(LLM_MAX_WORKERS, len(source_contents)))) as executor:
         futures = {
             executor.submit(process_source, source, contents): source
             for source, contents in source_contents.items()
@@ -440,7 +831,7 @@ def extract_deep_crawl_sources(tavily_client, location: str) -> Dict[str, List[R
 
     Optimizations:
     - Caches map and extract results to avoid redundant API calls
-    - Processes batches in parallel where possible
+    - Crawls sources in parallel, and fetches each source's pages in parallel batches
 
     Args:
         tavily_client: Initialized Tavily client
@@ -460,13 +851,14 @@ def extract_deep_crawl_sources(tavily_client, location: str) -> Dict[str, List[R
 
     print(f"\n  Deep crawling {len(deep_crawl_sources)} sources for individual restaurant pages...")
 
-    for source, config in deep_crawl_sources.items():
+    def crawl_single_source(source: str, config: Dict[str, Any]) -> tuple:
+        """Map, fetch, and parse one deep crawl source; restaurants is None on failure."""
         list_url = config.get('list_url')
         url_pattern = config.get('restaurant_url_pattern', '.*')
         max_restaurants = config.get('max_restaurants', 30)
 
         if not list_url:
-            continue
+            return source, None
 
         print(f"\n    [{source}] Discovering restaurant URLs from {list_url}...")
 
@@ -496,7 +888,7 @@ def extract_deep_crawl_sources(tavily_client, location: str) -> Dict[str, List[R
             print(f"    [{source}] Found {len(restaurant_urls)} restaurant pages (from {len(all_urls)} total links)")
 
             if not restaurant_urls:
-                continue
+                return source, None
 
             # Step 3: Extract content from individual restaurant pages
             # Check cache first, then fetch missing URLs
@@ -553,15 +945,31 @@ def extract_deep_crawl_sources(tavily_client, location: str) -> Dict[str, List[R
                     location=location
                 )
 
-                results_by_source[source] = restaurants
                 print(f"    ✓ {source}: Extracted {len(restaurants)} restaurants from {len(all_content)} pages")
+                return source, restaurants
 
         except Exception as e:
             print(f"    ✗ {source}: Error during deep crawl: {e}")
 
+        return source, None
+
+    # Crawl sources in parallel (each source also fetches its pages in parallel),
+    # capping the outer pool so a long sources.yaml can't multiply open requests
+    with ThreadPoolExecutor(max_workers=min(len(deep_crawl_sources), 5)) as executor:
+        futures = [
+            executor.submit(crawl_single_source, source, config)
+            for source, config in deep_crawl_sources.items()
+        ]
+
+        for future in as_completed(futures):
+            source, restaurants = future.result()
+            if restaurants is not None:
+                results_by_source[source] = restaurants
+
     return results_by_source
 
 
+@lru_cache(maxsize=512)
 def map_source_to_rank_field(source: str) -> str:
     """
     Map a source name to its corresponding rank field in the Restaurant model.
@@ -589,6 +997,14 @@ def map_source_to_rank_field(source: str) -> str:
         return ""
 
 
+# Fingerprint of the extraction prompt (system prompt plus the rendered user
+# template), part of the extraction cache key so editing prompts/extraction.py
+# invalidates previously parsed results
+EXTRACTION_PROMPT_VERSION = get_cache_key(
+    RESTAURANT_EXTRACTION_SYSTEM + restaurant_extraction_prompt(source='', location='', content='')
+)
+
+
 def llm_extract_restaurants(
     source: str,
     search_results: str,
@@ -601,7 +1017,9 @@ def llm_extract_restaurants(
     has full context of how each restaurant is featured in the source
     (position in list, prominence, language used).
 
-    Handles large content by processing in chunks if necessary.
+    Handles large content by processing in chunks if necessary. The parsed
+    result is cached per (model, extraction prompt, source, location, content
+    hash) so a rerun over unchanged pages makes no LLM calls.
 
     Args:
         source: Name of authoritative source
@@ -611,25 +1029,33 @@ def llm_extract_restaurants(
     Returns:
         List of Restaurant dictionaries with source-specific rankings populated
     """
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    # Cache the whole extraction result; keyed on content so an unchanged page
+    # also hits after the source's Tavily cache entry is refreshed, and on the
+    # model and prompt so changing either re-extracts
+    cache_key = (
+        f"extraction:{OPENAI_MODEL}|{EXTRACTION_PROMPT_VERSION}|"
+        f"{source}|{location}|{get_cache_key(search_results)}"
+    )
+    cached_restaurants = get_cached(cache_key, 'llm_extract')
+    if cached_restaurants is not None:
+        return cached_restaurants
+
+    client = get_openai_client()
 
     # For large content (like Eater heatmap with 30+ restaurants), process in chunks
     # GPT-4o-mini can handle ~128k tokens, but we chunk at 50k chars for efficiency
     MAX_CHUNK_SIZE = 50000
     all_restaurants = []
+    extraction_failed = False
 
     # Determine which rank field this source maps to
     rank_field = map_source_to_rank_field(source)
 
-    # Split content into chunks if needed
-    if len(search_results) > MAX_CHUNK_SIZE:
-        chunks = []
-        for i in range(0, len(search_results), MAX_CHUNK_SIZE):
-            chunks.append(search_results[i:i + MAX_CHUNK_SIZE])
-    else:
-        chunks = [search_results]
+    # Split content into chunks if needed (on paragraph boundaries)
+    chunks = split_content_chunks(search_results, MAX_CHUNK_SIZE)
 
-    for chunk_idx, chunk in enumerate(chunks):
+    def extract_chunk(chunk_idx: int, chunk: str) -> Optional[List[Restaurant]]:
+        """Extract restaurants from one chunk; returns None if the LLM call fails."""
         chunk_label = f" (chunk {chunk_idx + 1}/{len(chunks)})" if len(chunks) > 1 else ""
 
         system_prompt = RESTAURANT_EXTRACTION_SYSTEM
@@ -641,8 +1067,9 @@ def llm_extract_restaurants(
         )
 
         try:
-            response = client.chat.completions.create(
-                model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+            content = _stream_json(
+                client,
+                model=OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
@@ -651,9 +1078,10 @@ def llm_extract_restaurants(
             )
 
             import json
-            result = json.loads(response.choices[0].message.content)
+            result = json.loads(content)
 
-            # Convert to Restaurant TypedDict format and add to aggregate list
+            # Convert to Restaurant TypedDict format
+            chunk_restaurants = []
             for r in result.get('restaurants', []):
                 # Normalize price range to handle variants
                 raw_price = r.get('price_range', '')
@@ -668,7 +1096,7 @@ def llm_extract_restaurants(
                 if rank_field and source_rank > 0:
                     rank_kwargs[rank_field] = source_rank
 
-                all_restaurants.append(create_restaurant(
+                chunk_restaurants.append(create_restaurant(
                     name=r.get('name', ''),
                     booking_website=r.get('booking_website', ''),
                     description=r.get('description', ''),
@@ -678,12 +1106,31 @@ def llm_extract_restaurants(
                     priority_reasons=ranking_reason,  # Store the ranking reason for now
                     **rank_kwargs
                 ))
+            return chunk_restaurants
 
         except Exception as e:
             print(f"Error extracting restaurants from {source}{chunk_label}: {e}")
+            return None
+
+    # Chunks are independent, so extract them in parallel
+    if len(chunks) == 1:
+        chunk_results = [extract_chunk(0, chunks[0])]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(LLM_MAX_WORKERS, len(chunks))) as executor:
+            chunk_results = list(executor.map(extract_chunk, range(len(chunks)), chunks))
+
+    for chunk_restaurants in chunk_results:
+        if chunk_restaurants is None:
+            extraction_failed = True
+        else:
+            all_restaurants.extend(chunk_restaurants)
 
     # Deduplicate restaurants across chunks (same restaurant might appear in overlapping content)
-    return deduplicate_restaurants(all_restaurants)
+    restaurants = deduplicate_restaurants(all_restaurants)
+    if restaurants and not extraction_failed:
+        set_cached(cache_key, restaurants, 'llm_extract')
+    return restaurants
 
 
 def llm_generate_priority_reasons(
@@ -700,9 +1147,9 @@ def llm_generate_priority_reasons(
     Returns:
         Priority reasons string
     """
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    client = get_openai_client()
 
-    rankings_text = "\n".join([f"- {source}: {rank}/5.0" for source, rank in source_rankings.items()])
+    rankings_text = format_source_rankings(source_rankings)
 
     system_prompt = PRIORITY_REASONS_SYSTEM
     user_prompt = priority_reasons_prompt(
@@ -714,7 +1161,7 @@ def llm_generate_priority_reasons(
 
     try:
         response = client.chat.completions.create(
-            model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
@@ -728,24 +1175,145 @@ def llm_generate_priority_reasons(
         return "Featured in multiple authoritative DC food sources."
 
 
-def llm_parse_edit_command(user_message: str) -> Dict[str, Any]:
+def format_source_rankings(source_rankings: Dict[str, float]) -> str:
+    """Format source rankings as one "- Source: rank/5.0" line per source."""
+    return "\n".join([f"- {source}: {rank}/5.0" for source, rank in source_rankings.items()])
+
+
+def llm_generate_priority_reasons_batch(
+    batch: List[Tuple[Restaurant, Dict[str, float]]]
+) -> List[str]:
+    """
+    Generate priority reasons for several restaurants with one JSON-mode LLM call.
+
+    Restaurants missing from (or malformed in) the batched response fall back
+    to an individual llm_generate_priority_reasons call.
+
+    Args:
+        batch: List of (restaurant, source_rankings) pairs
+
+    Returns:
+        Priority reasons strings, in batch order
+    """
+    import json
+
+    if len(batch) == 1:
+        restaurant, source_rankings = batch[0]
+        return [llm_generate_priority_reasons(restaurant, source_rankings)]
+
+    client = get_openai_client()
+
+    items = [
+        {
+            "id": i,
+            "name": restaurant['name'],
+            "description": restaurant['description'],
+            "priority_rank": restaurant['priority_rank'],
+            "rankings_text": format_source_rankings(source_rankings)
+        }
+        for i, (restaurant, source_rankings) in enumerate(batch)
+    ]
+
+    reasons: Dict[int, str] = {}
+    try:
+        response = client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": PRIORITY_REASONS_SYSTEM},
+                {"role": "user", "content": priority_reasons_batch_prompt(items)}
+            ],
+            response_format={"type": "json_object"},
+            **llm_token_limit(PRIORITY_REASONS_TOKENS_PER_ITEM * len(items) + LLM_JSON_BATCH_OVERHEAD_TOKENS)
+        )
+
+        result = json.loads(response.choices[0].message.content or '{}')
+        for entry in result.get('reasons', []):
+            idx = entry.get('id')
+            text = entry.get('reasons')
+            if isinstance(idx, int) and 0 <= idx < len(batch) and isinstance(text, str) and text.strip():
+                reasons[idx] = text.strip()
+
+    except Exception as e:
+        print(f"Error generating batched priority reasons: {e}")
+
+    return [
+        reasons[i] if i in reasons else llm_generate_priority_reasons(restaurant, source_rankings)
+        for i, (restaurant, source_rankings) in enumerate(batch)
+    ]
+
+
+# Fast-path patterns for common edit commands, tried before the LLM parser.
+# Each maps to an action; the "name" group captures the restaurant name.
+EDIT_PATTERNS = [
+    (
+        re.compile(
+            r"^\s*(?:please\s+)?(?:remove|delete|drop)\s+['\"]?(?P<name>.+?)['\"]?"
+            r"(?:\s+from\s+(?:my|the)\s+(?:restaurant\s+)?list)?\s*[.!]?\s*$",
+            re.IGNORECASE
+        ),
+        "remove"
+    ),
+]
+
+
+def parse_edit_command_fast(user_message: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse simple edit commands (e.g., "Remove Rose's Luxury") without an LLM call.
+
+    Args:
+        user_message: User's edit command
+
+    Returns:
+        Dict with action, restaurant_name, field, new_value, or None if no
+        pattern matched and the LLM parser is needed
+    """
+    for pattern, action in EDIT_PATTERNS:
+        match = pattern.match(user_message)
+        if match:
+            return {
+                "action": action,
+                "restaurant_name": match.group('name').strip(),
+                "field": None,
+                "new_value": None
+            }
+    return None
+
+
+def llm_parse_edit_command(
+    user_message: str,
+    name_index: Optional[Dict[str, int]] = None
+) -> Dict[str, Any]:
     """
     Use LLM to parse natural language edit commands.
 
+    Simple commands matching EDIT_PATTERNS are parsed locally, but the fast
+    result is only trusted when the captured name is an exact restaurant in
+    name_index. Anything else ("Remove Kinship, it closed", "Delete Kinship
+    and Bresca") goes to the LLM.
+
     Args:
         user_message: User's edit command
+        name_index: Index from build_name_index over the current list
 
     Returns:
         Dict with action, restaurant_name, field, new_value
     """
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    fast_result = parse_edit_command_fast(user_message)
+    if (
+        fast_result is not None
+        and name_index is not None
+        and normalize_restaurant_name(fast_result['restaurant_name']) in name_index
+    ):
+        return fast_result
+
+    client = get_openai_client()
 
     system_prompt = EDIT_COMMAND_SYSTEM
     user_prompt = edit_command_prompt(user_message)
 
     try:
         response = client.chat.completions.create(
-            model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
@@ -761,8 +1329,28 @@ def llm_parse_edit_command(user_message: str) -> Dict[str, Any]:
         return {"action": "unknown", "restaurant_name": "", "field": None, "new_value": None}
 
 
-def find_restaurant_by_name(restaurants: List[Restaurant], name: str) -> Optional[Restaurant]:
-    """Find a restaurant in list by name (case-insensitive)."""
+def find_restaurant_by_name(
+    restaurants: List[Restaurant],
+    name: str,
+    name_index: Optional[Dict[str, int]] = None
+) -> Optional[Restaurant]:
+    """
+    Find a restaurant in list by name (case-insensitive).
+
+    Args:
+        restaurants: List to search
+        name: Restaurant name to find
+        name_index: Optional index from build_name_index over restaurants; when
+            given, lookup is a dict probe on the normalized name
+
+    Returns:
+        Matching restaurant, or None if not found
+    """
+    if name_index is not None:
+        idx = name_index.get(normalize_restaurant_name(name))
+        if idx is not None and idx < len(restaurants):
+            return restaurants[idx]
+
     name_lower = name.lower()
     for restaurant in restaurants:
         if restaurant['name'].lower() == name_lower:
@@ -778,8 +1366,10 @@ def enrich_missing_prices(
     """
     Enrich restaurants that have missing price ranges by searching for price info.
 
-    Uses Tavily to search for price information and LLM to extract the price tier.
-    Processes restaurants in parallel for efficiency.
+    Uses Tavily to search for price information (in parallel, one search per
+    restaurant), then extracts price tiers with JSON-mode LLM calls. Restaurants
+    are packed into as few calls as fit PRICE_ENRICHMENT_PROMPT_TOKEN_BUDGET
+    (at most PRICE_ENRICHMENT_BATCH_SIZE per call).
 
     Args:
         restaurants: List of restaurants, some potentially missing price_range
@@ -790,6 +1380,7 @@ def enrich_missing_prices(
         Same list with price_range filled in where possible
     """
     from concurrent.futures import ThreadPoolExecutor, as_completed
+    import json
 
     # Find restaurants missing prices
     missing_prices = [r for r in restaurants if not r.get('price_range')]
@@ -799,17 +1390,17 @@ def enrich_missing_prices(
 
     print(f"\n  Enriching prices for {len(missing_prices)} restaurants with missing price data...")
 
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    client = get_openai_client()
 
-    def enrich_single_restaurant(restaurant: Restaurant) -> tuple:
-        """Search for and extract price for a single restaurant."""
+    def search_single_restaurant(restaurant: Restaurant) -> tuple:
+        """Check the price cache, or search for price content for one restaurant."""
         name = restaurant['name']
 
         # Check cache first
         cache_key = f"price:{name}|{location}"
         cached_price = get_cached(cache_key, 'price')
         if cached_price:
-            return name, cached_price, "cache"
+            return name, cached_price, None, "cache"
 
         try:
             # Search for price information
@@ -832,52 +1423,122 @@ def enrich_missing_prices(
                     content_parts.append(snippet)
 
             if not content_parts:
-                return name, '', "no results"
+                return name, '', None, "no results"
 
-            combined_content = "\n\n".join(content_parts)
+            return name, '', "\n\n".join(content_parts), "searched"
 
-            # Use LLM to extract price
-            system_prompt = PRICE_ENRICHMENT_SYSTEM
-            user_prompt = price_enrichment_prompt(
-                restaurant_name=name,
-                location=location,
-                search_content=combined_content
-            )
+        except Exception as e:
+            return name, '', None, f"error: {e}"
 
-            response = client.chat.completions.create(
-                model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=10
-            )
+    def request_price_batch(batch: List[tuple]) -> Dict[str, str]:
+        """Extract price tiers for a batch of (name, content) pairs with one LLM call."""
+        items = [
+            {"id": i, "name": name, "search_content": content}
+            for i, (name, content) in enumerate(batch)
+        ]
 
-            raw_price = response.choices[0].message.content.strip() if response.choices[0].message.content else ''
-            normalized_price = normalize_price_range(raw_price)
+        response = client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": PRICE_ENRICHMENT_SYSTEM},
+                {"role": "user", "content": price_enrichment_prompt(
+                    location=location,
+                    items=items,
+                    max_content_chars=PRICE_ENRICHMENT_CONTENT_CHARS
+                )}
+            ],
+            response_format={"type": "json_object"},
+            **llm_token_limit(PRICE_ENRICHMENT_TOKENS_PER_ITEM * len(items) + LLM_JSON_BATCH_OVERHEAD_TOKENS)
+        )
+
+        result = json.loads(response.choices[0].message.content or '{}')
 
-            # Cache the result (even if empty, to avoid repeated lookups)
-            set_cached(cache_key, normalized_price, 'price')
+        prices = {}
+        for entry in result.get('prices', []):
+            idx = entry.get('id')
+            if isinstance(idx, int) and 0 <= idx < len(batch):
+                prices[batch[idx][0]] = normalize_price_range(str(entry.get('price_range', '')))
+        return prices
 
-            return name, normalized_price, "searched"
+    def extract_price_batch(batch: List[tuple]) -> Dict[str, str]:
+        """
+        Extract prices for a batch, retrying restaurants the batched call missed one at a time.
 
+        Returns only restaurants the LLM actually answered for, so a failed
+        lookup isn't cached as "unknown".
+        """
+        try:
+            prices = request_price_batch(batch)
         except Exception as e:
-            return name, '', f"error: {e}"
+            if len(batch) == 1:
+                raise
+            print(f"    ✗ Error extracting price batch, retrying individually: {e}")
+            prices = {}
+
+        if len(batch) > 1:
+            for name, content in batch:
+                if name in prices:
+                    continue
+                try:
+                    prices.update(request_price_batch([(name, content)]))
+                except Exception as e:
+                    print(f"    ✗ Error extracting price for {name}: {e}")
+
+        return prices
 
-    # Process in parallel
     results = {}
+    to_extract = []
+
+    # Search in parallel
     with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {
-            executor.submit(enrich_single_restaurant, r): r
-            for r in missing_prices
-        }
+        futures = [executor.submit(search_single_restaurant, r) for r in missing_prices]
 
         for future in as_completed(futures):
-            name, price, source = future.result()
+            name, price, content, source = future.result()
+            if content:
+                to_extract.append((name, content))
+                continue
             results[name.lower()] = price
             status = f"→ {price}" if price else "→ unknown"
             print(f"    {name}: {status} ({source})")
 
+    # Extract prices in batched LLM calls (batches run in parallel)
+    if to_extract:
+        sizes = [
+            estimate_tokens(name) + estimate_tokens(content[:PRICE_ENRICHMENT_CONTENT_CHARS])
+            for name, content in to_extract
+        ]
+        batches = _pack_prompts(
+            to_extract,
+            sizes,
+            token_budget=PRICE_ENRICHMENT_PROMPT_TOKEN_BUDGET,
+            max_items=PRICE_ENRICHMENT_BATCH_SIZE
+        )
+        print(f"    Extracting prices for {len(to_extract)} restaurants in {len(batches)} LLM call(s)...")
+
+        with ThreadPoolExecutor(max_workers=min(LLM_MAX_WORKERS, len(batches))) as executor:
+            futures = {executor.submit(extract_price_batch, batch): batch for batch in batches}
+
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    prices = future.result()
+                except Exception as e:
+                    print(f"    ✗ Error extracting price batch: {e}")
+                    continue
+
+                for name, _ in batch:
+                    price = prices.get(name, '')
+                    results[name.lower()] = price
+
+                    # Cache the answer (even if empty, to avoid repeated
+                    # lookups), but not a lookup that errored
+                    if name in prices:
+                        set_cached(f"price:{name}|{location}", price, 'price')
+
+                    status = f"→ {price}" if price else "→ unknown"
+                    print(f"    {name}: {status} (searched)")
+
     # Update restaurants with enriched prices
     enriched_count = 0
     for restaurant in restaurants:
@@ -896,21 +1557,28 @@ def enrich_missing_prices(
 # Graph Nodes (Section 4)
 # ============================================================================
 
+# Keyword routing for user messages, checked in order. Each keyword stem must
+# start a word and may take any suffix ("updated", "removing", "listing"), so
+# words that merely contain one, like "renewal" or "overview", don't trigger
+# an action.
+USER_ACTION_PATTERNS = (
+    (re.compile(r'\b(?:find|found|discover|search|new|updat)\w*', re.IGNORECASE), 'discover'),
+    (re.compile(r'\b(?:remov|delet|edit|chang)\w*', re.IGNORECASE), 'edit'),
+    (re.compile(r'\b(?:show|view|list)\w*', re.IGNORECASE), 'view'),
+)
+
+
 def initiate_discovery(state: RestaurantListState) -> RestaurantListState:
     """
     Parse user request and initialize discovery process.
     """
-    user_message = state['user_message'].lower()
+    user_message = state['user_message']
 
-    # Determine user action
-    if any(keyword in user_message for keyword in ['find', 'discover', 'search', 'new', 'update']):
-        state['user_action'] = 'discover'
-    elif any(keyword in user_message for keyword in ['remove', 'delete', 'edit', 'change']):
-        state['user_action'] = 'edit'
-    elif any(keyword in user_message for keyword in ['show', 'view', 'list']):
-        state['user_action'] = 'view'
-    else:
-        state['user_action'] = 'discover'  # Default
+    # Determine user action (first matching action wins; default: discover)
+    state['user_action'] = next(
+        (action for pattern, action in USER_ACTION_PATTERNS if pattern.search(user_message)),
+        'discover'
+    )
 
     # Initialize discovery fields
     state['discovered_restaurants'] = []
@@ -929,6 +1597,10 @@ def run_source_search(tavily_client, location: str, sources: List[str]) -> Dict[
     Strategy 2: Uses tailored search queries for each source.
     Includes caching for search results.
 
+    Every (source, query) pair is submitted to the pool independently, so the
+    Tavily search + LLM extraction for all queries run concurrently and wall
+    time tracks the slowest query rather than the sum of a source's queries.
+
     Args:
         tavily_client: Initialized Tavily client
         location: City/region for filtering
@@ -941,82 +1613,106 @@ def run_source_search(tavily_client, location: str, sources: List[str]) -> Dict[
 
     results_by_source = {}
 
-    def search_single_source(source: str) -> tuple:
-        """Search a single source using source-specific queries."""
+    def search_single_query(source: str, query: str, source_domain: str) -> tuple:
+        """Search one source-specific query and extract its restaurants."""
         try:
-            source_domain = get_source_domain(source)
-            search_queries_config = get_search_queries()
-            queries = search_queries_config.get(source, [f"best restaurants {location}"])
-
-            source_restaurants = []
-
-            for query in queries:
-                # Create cache key from query + domain
-                cache_key = f"{query}|{source_domain or 'all'}"
-
-                # Check cache first
-                cached_results = get_cached(cache_key, 'search')
-                if cached_results:
-                    content_snippets = cached_results
-                else:
-                    search_params = {
-                        "query": query,
-                        "search_depth": "basic",
-                        "max_results": 5,
-                        "include_raw_content": True
-                    }
-
-                    if source_domain:
-                        search_params["include_domains"] = [source_domain]
-
-                    search_results = tavily_client.search(**search_params)
+            # Create cache key from query + domain
+            cache_key = f"{query}|{source_domain or 'all'}"
 
-                    # Extract content snippets
-                    content_snippets = []
-                    for result in search_results.get('results', []):
-                        raw = result.get('raw_content', '')
-                        snippet = result.get('content', '')
-                        content = raw if raw else snippet
-                        if content:
-                            content_snippets.append(content)
+            # Check cache first
+            cached_results = get_cached(cache_key, 'search')
+            if cached_results:
+                content_snippets = cached_results
+            else:
+                search_params = {
+                    "query": query,
+                    "search_depth": "basic",
+                    "max_results": 5,
+                    "include_raw_content": True
+                }
+
+                if source_domain:
+                    search_params["include_domains"] = [source_domain]
+
+                search_results = tavily_client.search(**search_params)
+
+                # Extract content snippets
+                content_snippets = []
+                for result in search_results.get('results', []):
+                    raw = result.get('raw_content', '')
+                    snippet = result.get('content', '')
+                    content = raw if raw else snippet
+                    if content:
+                        content_snippets.append(content)
 
-                    # Cache the content snippets
-                    set_cached(cache_key, content_snippets, 'search')
+                # Cache the content snippets
+                set_cached(cache_key, content_snippets, 'search')
 
-                combined_content = "\n\n".join(content_snippets)
+            combined_content = "\n\n".join(content_snippets)
 
-                if combined_content:
-                    restaurants = llm_extract_restaurants(
-                        source=source,
-                        search_results=combined_content,
-                        location=location
-                    )
-                    source_restaurants.extend(restaurants)
+            restaurants = []
+            if combined_content:
+                restaurants = llm_extract_restaurants(
+                    source=source,
+                    search_results=combined_content,
+                    location=location
+                )
 
-            # Deduplicate within this source
-            unique_source_restaurants = deduplicate_restaurants(source_restaurants)
-            return source, unique_source_restaurants, None
+            return source, restaurants, None
 
         except Exception as e:
             return source, [], str(e)
 
+    # Resolve config lookups once per source rather than once per query
+    search_queries_config = get_search_queries()
+    source_domains = {source: get_source_domain(source) for source in sources}
+    tasks = [
+        (source, query, source_domains[source])
+        for source in sources
+        for query in search_queries_config.get(source, [f"best restaurants {location}"])
+    ]
+
     # Execute searches in parallel
-    print(f"  Searching {len(sources)} sources with tailored queries (parallel)...")
+    print(f"  Searching {len(sources)} sources with {len(tasks)} tailored queries (parallel)...")
+
+    source_restaurants: Dict[str, List[Restaurant]] = {}
+    source_errors: Dict[str, str] = {}
+    seen_names: Set[str] = set()
+    skipped = 0
 
     with ThreadPoolExecutor(max_workers=6) as executor:
-        future_to_source = {
-            executor.submit(search_single_source, source): source
-            for source in sources
-        }
+        futures = {executor.submit(search_single_query, *task): task[0] for task in tasks}
+
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
 
-        for i, future in enumerate(as_completed(future_to_source), 1):
             source, restaurants, error = future.result()
 
             if error:
-                print(f"    [{i}/{len(sources)}] ✗ {source}: {error}")
+                source_errors[source] = error
             else:
-                print(f"    [{i}/{len(sources)}] ✓ {source}: Found {len(restaurants)} restaurants")
-                results_by_source[source] = restaurants
+                source_restaurants.setdefault(source, []).extend(restaurants)
+                seen_names.update(normalize_restaurant_name(r['name']) for r in restaurants)
+
+            # Early termination: once enough unique restaurants are in, drop
+            # queued queries only for sources that have already returned at
+            # least one restaurant, so every source still gets results
+            if SOURCE_SEARCH_TARGET_UNIQUE and len(seen_names) >= SOURCE_SEARCH_TARGET_UNIQUE:
+                for pending, pending_source in futures.items():
+                    if source_restaurants.get(pending_source) and pending.cancel():
+                        skipped += 1
+
+    if skipped:
+        print(f"  Reached {len(seen_names)} unique restaurants, skipped {skipped} remaining queries")
+
+    for i, source in enumerate(sources, 1):
+        if source in source_restaurants:
+            # Deduplicate within this source
+            results_by_source[source] = deduplicate_restaurants(source_restaurants[source])
+            print(f"    [{i}/{len(sources)}] ✓ {source}: Found {len(results_by_source[source])} restaurants")
+        elif source in source_errors:
+            print(f"    [{i}/{len(sources)}] ✗ {source}: {source_errors[source]}")
 
     return results_by_source
 
@@ -1033,20 +1729,20 @@ def search_sources(state: RestaurantListState) -> RestaurantListState:
     Optimizations:
     - All 3 strategies run in parallel for 2-3x speedup
     - Each strategy uses internal parallelization and caching
+    - The current list is fetched from Google Sheets concurrently, so the
+      discovery flow goes straight from evaluation to compare_lists
     """
-    from tavily import TavilyClient
     from concurrent.futures import ThreadPoolExecutor, as_completed
     import time
 
     start_time = time.time()
 
-    location = os.getenv('LOCATION_CITY', 'Washington DC')
-    tavily_api_key = os.getenv('TAVILY_API_KEY')
+    location = Config.LOCATION_CITY
 
-    if not tavily_api_key:
+    if not Config.TAVILY_API_KEY:
         state['errors'].append("TAVILY_API_KEY not found in .env file")
         print("Error: TAVILY_API_KEY not set. Please add it to your .env file.")
-        return state
+        return fetch_current_list(state)
 
     # Authoritative sources for Strategy 2
     sources = [
@@ -1058,11 +1754,11 @@ def search_sources(state: RestaurantListState) -> RestaurantListState:
     ]
 
     try:
-        tavily_client = TavilyClient(api_key=tavily_api_key)
+        tavily_client = get_tavily_client()
     except Exception as e:
         state['errors'].append(f"Failed to initialize Tavily client: {str(e)}")
         print(f"Error initializing Tavily: {e}")
-        return state
+        return fetch_current_list(state)
 
     cache_status = "enabled" if is_cache_enabled() else "disabled"
     print(f"\nSearching for restaurants in {location}... (cache: {cache_status})")
@@ -1071,11 +1767,14 @@ def search_sources(state: RestaurantListState) -> RestaurantListState:
     # =========================================================================
     # Run all 3 strategies in PARALLEL
     # =========================================================================
-    all_discovered = []
     results_by_source = {}
     strategy_results = {}
 
-    with ThreadPoolExecutor(max_workers=3) as executor:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # The Sheets read has no dependency on discovery, so it runs alongside
+        # the strategies instead of as a separate step after evaluation
+        future_current_list = executor.submit(fetch_current_list, state)
+
         # Submit all 3 strategies
         future_strategy1 = executor.submit(extract_known_urls, tavily_client, location)
         future_strategy2 = executor.submit(run_source_search, tavily_client, location, sources)
@@ -1102,25 +1801,38 @@ def search_sources(state: RestaurantListState) -> RestaurantListState:
                 print(f"[ERROR] {strategy_name}: {e}")
                 state['errors'].append(f"{strategy_name} failed: {str(e)}")
 
+        future_current_list.result()
+
     # =========================================================================
     # Combine results from all strategies
     # =========================================================================
     print("\nCombining results from all strategies...")
 
+    # Exact duplicates (same normalized name) are merged as they stream in,
+    # so only one entry per name reaches the fuzzy deduplication pass
+    by_name: Dict[str, Restaurant] = {}
+    total_found = 0
+
     for strategy_name, result in strategy_results.items():
         for source, restaurants in result.items():
-            if source not in results_by_source:
-                results_by_source[source] = []
-            results_by_source[source].extend(restaurants)
-            all_discovered.extend(restaurants)
+            results_by_source.setdefault(source, []).extend(restaurants)
+            total_found += len(restaurants)
+
+            for restaurant in restaurants:
+                name_key = normalize_restaurant_name(restaurant['name'])
+                existing = by_name.get(name_key)
+                if existing is None:
+                    by_name[name_key] = restaurant
+                else:
+                    merge_restaurant_data(existing, restaurant)
 
     # =========================================================================
     # Deduplicate all results
     # =========================================================================
-    unique_restaurants = deduplicate_restaurants(all_discovered)
+    unique_restaurants = deduplicate_restaurants(list(by_name.values()))
 
     elapsed_time = time.time() - start_time
-    print(f"\nTotal restaurants found: {len(all_discovered)}")
+    print(f"\nTotal restaurants found: {total_found}")
     print(f"Unique restaurants after deduplication: {len(unique_restaurants)}")
     print(f"Search completed in {elapsed_time:.1f} seconds\n")
 
@@ -1136,93 +1848,92 @@ def evaluate_restaurants(state: RestaurantListState) -> RestaurantListState:
 
     Source rankings are now populated during extraction (combined extraction+ranking),
     so this function just aggregates them into an overall priority_rank and
-    generates the final priority_reasons text.
+    generates the final priority_reasons text for restaurants that pass the
+    priority cutoff.
     """
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     print("Aggregating rankings and generating priority reasons...")
 
-    def aggregate_and_generate_reasons(restaurant: Restaurant) -> Restaurant:
-        """Aggregate source rankings and generate priority reasons for one restaurant."""
+    # Per-restaurant ranking lines, written in one print once ranking is done
+    log_lines: List[str] = []
+
+    def aggregate_source_rankings(restaurant: Restaurant) -> Dict[str, float]:
+        """Collect non-zero source rankings and set the averaged priority_rank."""
         # Collect all non-zero source rankings
-        source_rankings = {}
-        if restaurant.get('eater_dc_rank', 0) > 0:
-            source_rankings['Eater DC'] = restaurant['eater_dc_rank']
-        if restaurant.get('michelin_guide_rank', 0) > 0:
-            source_rankings['Michelin Guide'] = restaurant['michelin_guide_rank']
-        if restaurant.get('washington_post_rank', 0) > 0:
-            source_rankings['Washington Post'] = restaurant['washington_post_rank']
-        if restaurant.get('washingtonian_rank', 0) > 0:
-            source_rankings['Washingtonian'] = restaurant['washingtonian_rank']
-        if restaurant.get('infatuation_rank', 0) > 0:
-            source_rankings['Infatuation'] = restaurant['infatuation_rank']
+        source_rankings = {
+            display_name: rank
+            for field, display_name in _RANK_FIELD_DISPLAY_NAMES
+            if (rank := restaurant.get(field, 0)) > 0
+        }
 
         # Calculate overall priority rank (average of source rankings)
         if source_rankings:
             overall_rank = sum(source_rankings.values()) / len(source_rankings)
             restaurant['priority_rank'] = round(overall_rank, 1)
 
-            # Generate priority reasons (LLM call to synthesize a compelling summary)
-            restaurant['priority_reasons'] = llm_generate_priority_reasons(
-                restaurant=restaurant,
-                source_rankings=source_rankings
-            )
-
             # Print rankings
             sources_str = ", ".join([f"{s}={r}" for s, r in source_rankings.items()])
-            print(f"  ✓ {restaurant['name']}: {sources_str} → avg {restaurant['priority_rank']}/5.0")
+            log_lines.append(f"  ✓ {restaurant['name']}: {sources_str} → avg {restaurant['priority_rank']}/5.0")
         else:
             restaurant['priority_rank'] = 0.0
             if not restaurant.get('priority_reasons'):
                 restaurant['priority_reasons'] = "No source rankings available"
-            print(f"  ✗ {restaurant['name']}: No source rankings")
-
-        return restaurant
+            log_lines.append(f"  ✗ {restaurant['name']}: No source rankings")
 
-    # Process all restaurants in parallel (for priority reasons generation)
-    evaluated_restaurants = []
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_restaurant = {
-            executor.submit(aggregate_and_generate_reasons, restaurant): restaurant
-            for restaurant in state['discovered_restaurants']
-        }
+        return source_rankings
 
-        for future in as_completed(future_to_restaurant):
-            try:
-                evaluated_restaurant = future.result()
-                evaluated_restaurants.append(evaluated_restaurant)
-            except Exception as e:
-                restaurant = future_to_restaurant[future]
-                print(f"  ✗ Error evaluating {restaurant['name']}: {e}")
-                restaurant['priority_rank'] = 0.0
-                restaurant['priority_reasons'] = "Evaluation failed"
-                evaluated_restaurants.append(restaurant)
-
-    # Enrich missing prices before filtering
-    missing_price_count = sum(1 for r in evaluated_restaurants if not r.get('price_range'))
+    # Aggregating is cheap arithmetic, so rank everything first and filter out
+    # low priority restaurants (below 2.0) before paying for any LLM calls
+    ranked = [
+        (restaurant, aggregate_source_rankings(restaurant))
+        for restaurant in state['discovered_restaurants']
+    ]
+    filtered_ranked = [
+        (restaurant, source_rankings) for restaurant, source_rankings in ranked
+        if restaurant['priority_rank'] >= 2.0
+    ]
+    if log_lines:
+        print("\n".join(log_lines))
+
+    # Generate priority reasons for the remaining restaurants, several per
+    # LLM call, with batches running in parallel
+    batches = [
+        filtered_ranked[i:i + PRIORITY_REASONS_BATCH_SIZE]
+        for i in range(0, len(filtered_ranked), PRIORITY_REASONS_BATCH_SIZE)
+    ]
+    filtered = []
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(LLM_MAX_WORKERS, len(batches))) as executor:
+            future_to_batch = {
+                executor.submit(llm_generate_priority_reasons_batch, batch): batch
+                for batch in batches
+            }
+
+            for future in as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                try:
+                    for (restaurant, _), reasons in zip(batch, future.result()):
+                        restaurant['priority_reasons'] = reasons
+                except Exception as e:
+                    print(f"  ✗ Error generating priority reasons: {e}")
+                filtered.extend(restaurant for restaurant, _ in batch)
+
+    print(f"\nRestaurants after filtering (>= 2.0 priority): {len(filtered)}/{len(ranked)}\n")
+
+    # Enrich missing prices for the remaining restaurants
+    missing_price_count = sum(1 for r in filtered if not r.get('price_range'))
     if missing_price_count > 0:
         try:
-            from tavily import TavilyClient
-            tavily_api_key = os.getenv('TAVILY_API_KEY')
-            if tavily_api_key:
-                tavily_client = TavilyClient(api_key=tavily_api_key)
-                location = os.getenv('LOCATION_CITY', 'Washington DC')
-                evaluated_restaurants = enrich_missing_prices(
-                    evaluated_restaurants,
-                    tavily_client,
-                    location
+            if Config.TAVILY_API_KEY:
+                filtered = enrich_missing_prices(
+                    filtered,
+                    get_tavily_client(),
+                    Config.LOCATION_CITY
                 )
         except Exception as e:
             print(f"  Warning: Price enrichment failed: {e}")
 
-    # Filter out low priority restaurants (below 2.0)
-    filtered = [
-        r for r in evaluated_restaurants
-        if r['priority_rank'] >= 2.0
-    ]
-
-    print(f"\nRestaurants after filtering (>= 2.0 priority): {len(filtered)}/{len(evaluated_restaurants)}\n")
-
     state['discovered_restaurants'] = filtered
 
     return state
@@ -1233,13 +1944,15 @@ def fetch_current_list(state: RestaurantListState) -> RestaurantListState:
     Retrieve existing restaurant list from Google Sheets.
     """
     try:
-        sheets_client = GoogleSheetsClient()
+        sheets_client = get_sheets_client()
         current_list = sheets_client.get_all_restaurants()
         state['current_list'] = current_list
     except Exception as e:
         state['errors'].append(f"Failed to fetch current list: {str(e)}")
         state['current_list'] = []
 
+    state['current_name_index'] = build_name_index(state['current_list'])
+
     return state
 
 
@@ -1247,14 +1960,30 @@ def compare_lists(state: RestaurantListState) -> RestaurantListState:
     """
     Compare discovered restaurants against current list.
     Identify new restaurants to add.
+
+    Exact matches on the normalized name are resolved with a lookup in the
+    current_name_index built by fetch_current_list; remaining names are
+    fuzzy-matched in one rapidfuzz scan against only the current-list names
+    that share a blocking key, so near-duplicates aren't proposed again.
     """
-    current_names = {r['name'].lower() for r in state['current_list']}
+    current_name_index = state.get('current_name_index')
+    if current_name_index is None:
+        current_name_index = build_name_index(state['current_list'])
+        state['current_name_index'] = current_name_index
+    current_blocks = build_name_blocks(list(current_name_index))
+
+    # Additions: in discovered but not (even approximately) in current
+    restaurants_to_add = []
+    for restaurant in state['discovered_restaurants']:
+        name_lower = normalize_restaurant_name(restaurant['name'])
+        if name_lower in current_name_index:
+            continue
+        candidates = get_block_candidates(name_lower, current_blocks)
+        if find_fuzzy_match(name_lower, candidates) is not None:
+            continue
+        restaurants_to_add.append(restaurant)
 
-    # Additions: in discovered but not in current
-    state['restaurants_to_add'] = [
-        r for r in state['discovered_restaurants']
-        if r['name'].lower() not in current_names
-    ]
+    state['restaurants_to_add'] = restaurants_to_add
 
     # Removals: Not implemented in MVP (manual removal via conversational editing)
     state['restaurants_to_remove'] = []
@@ -1272,20 +2001,24 @@ def present_recommendations(state: RestaurantListState) -> RestaurantListState:
         state['recommendation_message'] = "I didn't find any new restaurants to add. Your list is up to date!"
         return state
 
-    # Build recommendation message
-    message = f"I found {num_additions} new restaurant{'s' if num_additions > 1 else ''} for your list:\n\n"
-    message += "NEW RESTAURANTS:\n"
+    # Build recommendation message (parts joined once at the end)
+    parts = [
+        f"I found {num_additions} new restaurant{'s' if num_additions > 1 else ''} for your list:\n\n",
+        "NEW RESTAURANTS:\n"
+    ]
 
     for i, restaurant in enumerate(state['restaurants_to_add'], 1):
-        message += f"\n{i}. **{restaurant['name']}**\n"
-        message += f"   Description: {restaurant['description']}\n"
-        message += f"   Overall Priority Rank: {restaurant['priority_rank']}/5.0\n"
-        message += f"   Priority Reasons: {restaurant['priority_reasons']}\n"
-        message += f"   Cuisine: {restaurant['cuisine_type']} | Price: {restaurant['price_range']}\n"
+        parts.append(
+            f"\n{i}. **{restaurant['name']}**\n"
+            f"   Description: {restaurant['description']}\n"
+            f"   Overall Priority Rank: {restaurant['priority_rank']}/5.0\n"
+            f"   Priority Reasons: {restaurant['priority_reasons']}\n"
+            f"   Cuisine: {restaurant['cuisine_type']} | Price: {restaurant['price_range']}\n"
+        )
 
-    message += "\n\nWould you like to add these restaurants to your list?"
+    parts.append("\n\nWould you like to add these restaurants to your list?")
 
-    state['recommendation_message'] = message
+    state['recommendation_message'] = "".join(parts)
     return state
 
 
@@ -1301,36 +2034,40 @@ def update_google_sheet(state: RestaurantListState) -> RestaurantListState:
     """
     Add approved restaurants to Google Sheets using batch insert to avoid rate limits.
     """
-    import sys
-    print("\n" + "="*60, flush=True)
-    print("UPDATE_GOOGLE_SHEET FUNCTION CALLED", flush=True)
-    print("="*60, flush=True)
-    print(f"[DEBUG] Attempting to add {len(state['restaurants_to_add'])} restaurants to Google Sheets...", flush=True)
-    print(f"[DEBUG] User approval status: {state.get('user_approval')}", flush=True)
-    sys.stdout.flush()
+    logger.debug(
+        "update_google_sheet: adding %d restaurants (approval=%s)",
+        len(state['restaurants_to_add']), state.get('user_approval')
+    )
 
     try:
-        sheets_client = GoogleSheetsClient()
-        print("[DEBUG] Google Sheets client initialized", flush=True)
+        sheets_client = get_sheets_client()
 
-        # Convert Restaurant TypedDicts to plain dicts for compatibility
-        restaurants_to_add = [dict(r) for r in state['restaurants_to_add']]
+        # Restaurant TypedDicts are plain dicts, so they're passed through as-is
+        restaurants_to_add = state['restaurants_to_add']
 
         # Use batch insert (single API call) to avoid rate limits
-        print(f"[DEBUG] Adding {len(restaurants_to_add)} restaurants in single batch...", flush=True)
         sheets_client.add_multiple_restaurants(restaurants_to_add)
 
+        # Keep the in-memory snapshot of the sheet (and its name index) in sync
+        # with what was written
+        current_list = list(state.get('current_list') or [])
+        current_name_index = dict(state.get('current_name_index') or build_name_index(current_list))
+        for restaurant in restaurants_to_add:
+            current_name_index.setdefault(normalize_restaurant_name(restaurant['name']), len(current_list))
+            current_list.append(restaurant)
+        state['current_list'] = current_list
+        state['current_name_index'] = current_name_index
+
         # Update last discovery date
         state['last_discovery_date'] = datetime.now()
 
-        print(f"\n✅ Successfully added {len(restaurants_to_add)} restaurants to Google Sheets\n", flush=True)
+        print(f"\n✅ Successfully added {len(restaurants_to_add)} restaurants to Google Sheets\n")
 
     except Exception as e:
         error_msg = f"Failed to initialize Google Sheets: {str(e)}"
-        print(f"\n❌ ERROR: {error_msg}\n", flush=True)
+        print(f"\n❌ ERROR: {error_msg}\n")
         state['errors'].append(error_msg)
-        import traceback
-        traceback.print_exc()
+        logger.error("update_google_sheet failed", exc_info=True)
 
     return state
 
@@ -1341,14 +2078,21 @@ def handle_conversational_edit(state: RestaurantListState) -> RestaurantListStat
     """
     user_message = state['user_message']
 
+    # Index of the current list (reused across edits)
+    name_index = state.get('current_name_index')
+    if name_index is None:
+        name_index = build_name_index(state['current_list'])
+        state['current_name_index'] = name_index
+
     # Use LLM to parse edit intent
-    edit_intent = llm_parse_edit_command(user_message)
+    edit_intent = llm_parse_edit_command(user_message, name_index)
 
     if edit_intent['action'] == 'remove':
         # Find restaurant in current list
         restaurant = find_restaurant_by_name(
             state['current_list'],
-            edit_intent['restaurant_name']
+            edit_intent['restaurant_name'],
+            name_index
         )
         if restaurant:
             state['restaurants_to_remove'] = [restaurant]
@@ -1457,7 +2201,7 @@ def build_restaurant_list_graph() -> StateGraph:
 
     # Discovery flow
     graph.add_edge("search_sources", "evaluate_restaurants")
-    graph.add_edge("evaluate_restaurants", "fetch_current_list")
+    graph.add_edge("evaluate_restaurants", "compare_lists")
     graph.add_edge("fetch_current_list", "compare_lists")
     graph.add_edge("compare_lists", "present_recommendations")
     graph.add_edge("present_recommendations", "await_user_approval")
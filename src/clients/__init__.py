@@ -3,5 +3,6 @@ External API clients for Google Sheets, OpenTable, Resy, Tock, and Yelp.
 """
 
 from .google_sheets_client import GoogleSheetsClient
+from .tavily_client import RateLimitedTavilyClient
 
-__all__ = ['GoogleSheetsClient']
+__all__ = ['GoogleSheetsClient', 'RateLimitedTavilyClient']
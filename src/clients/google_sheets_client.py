@@ -7,9 +7,14 @@ and manage the "Date Night Restaurant List" spreadsheet.
 Based on requirements in GoogleAPI.md and PRD.md (FR-2.1)
 """
 
+import json
+import logging
 import os
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Any, Iterator
 from pathlib import Path
 
 from google.auth.transport.requests import Request
@@ -19,13 +24,70 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
 
+from models.restaurant import SHEETS_FIELDS, SHEETS_ROW_DEFAULTS, restaurant_from_sheets_row
+from utils.cache import get_cache_key
+from utils.config import Config
+
 
 # Load environment variables
 load_dotenv()
 
+# Status messages go to this logger (silent below WARNING unless configured,
+# e.g. by main.py --verbose); interactive auth prompts stay on stdout
+logger = logging.getLogger(__name__)
+
 # OAuth 2.0 scope for Google Sheets
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Max age of the in-memory get_all_restaurants snapshot. Writes made through
+# the client invalidate it immediately; the age limit picks up edits made
+# directly in the spreadsheet.
+READ_CACHE_SECONDS = float(os.getenv('GOOGLE_SHEETS_READ_CACHE_SECONDS', '60'))
+
+# Refresh access tokens this close to expiry up front, so the first request
+# of a short CLI run doesn't fail with 401 mid-call
+TOKEN_REFRESH_MARGIN = timedelta(seconds=30)
+
+# HTTP statuses worth retrying (rate limit / transient server errors)
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _execute_with_retry(request, max_attempts: int = 6, base_delay: float = 1.0) -> Any:
+    """
+    Execute a Sheets API request, retrying rate-limit and transient errors.
+
+    Waits for the server's Retry-After when given, otherwise
+    base_delay * 2**attempt seconds (capped at 60), plus up to a second of
+    jitter so concurrent callers don't retry in lockstep.
+
+    Args:
+        request: Unexecuted googleapiclient request
+        max_attempts: Total attempts before giving up
+        base_delay: Initial backoff in seconds
+
+    Returns:
+        The API response
+
+    Raises:
+        HttpError: If the request fails with a non-retryable status or
+            all attempts are exhausted
+    """
+    for attempt in range(max_attempts):
+        try:
+            return request.execute()
+        except HttpError as error:
+            if error.resp.status not in RETRYABLE_STATUSES or attempt == max_attempts - 1:
+                raise
+
+            try:
+                delay = float(error.resp.get('retry-after'))
+            except (TypeError, ValueError):
+                delay = min(60.0, base_delay * 2 ** attempt)
+            delay += random.random()
+
+            logger.warning("Sheets API returned %s, retrying in %.1fs", error.resp.status, delay)
+            time.sleep(delay)
+
 
 class GoogleSheetsClient:
     """
@@ -35,22 +97,9 @@ class GoogleSheetsClient:
     in the "Date Night Restaurant List" spreadsheet.
     """
 
-    # Column mapping based on RestaurantListAgent.md specification
-    COLUMNS = {
-        'name': 'A',
-        'booking_website': 'B',
-        'description': 'C',
-        'priority_reasons': 'D',
-        'price_range': 'E',
-        'cuisine_type': 'F',
-        'eater_dc_rank': 'G',
-        'michelin_guide_rank': 'H',
-        'washington_post_rank': 'I',
-        'washingtonian_rank': 'J',
-        'infatuation_rank': 'K',
-        'priority_rank': 'L',
-        'date_added': 'M'
-    }
+    # Column mapping based on RestaurantListAgent.md specification; the field
+    # order itself is defined once in models.restaurant.SHEETS_FIELDS
+    COLUMNS = {field: chr(ord('A') + index) for index, field in enumerate(SHEETS_FIELDS)}
 
     HEADER_ROW = [
         'Restaurant Name',
@@ -68,6 +117,15 @@ class GoogleSheetsClient:
         'Date Added'
     ]
 
+    # Zero-based column position of each field
+    _COLUMN_INDEX = {field: index for index, field in enumerate(SHEETS_FIELDS)}
+
+    # Value written for each column (in order) when a restaurant lacks the field
+    _ROW_DEFAULTS = SHEETS_ROW_DEFAULTS
+
+    # Max rows queued by add_restaurant inside batched() before an automatic flush
+    BATCH_SIZE = 100
+
     def __init__(self):
         """Initialize the Google Sheets client with credentials from .env"""
         self.spreadsheet_id = os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID')
@@ -84,13 +142,24 @@ class GoogleSheetsClient:
         self.service = None
         self._authenticate()
 
+        # Last get_all_restaurants result; dirty until read, and after any write
+        self._restaurant_cache: Optional[List[Dict[str, Any]]] = None
+        self._restaurant_cache_time = 0.0
+        self._cache_dirty = True
+
+        # Rows queued by add_restaurant while inside batched()
+        self._pending_rows: List[List[Any]] = []
+        self._batching = False
+
     def _authenticate(self) -> None:
         """
         Authenticate with Google Sheets API using OAuth 2.0.
 
         On first run, opens browser for user authentication.
         On subsequent runs, uses stored token from token.json.
-        Automatically refreshes expired tokens.
+        Automatically refreshes expired or nearly expired tokens.
+        The service is built from the discovery document bundled with
+        google-api-python-client, so no discovery request is made.
         """
         creds = None
 
@@ -98,11 +167,17 @@ class GoogleSheetsClient:
         if Path(self.token_file).exists():
             creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
 
+        # google-auth stores expiry as naive UTC
+        expiring_soon = bool(
+            creds and creds.valid and creds.expiry
+            and creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None) < TOKEN_REFRESH_MARGIN
+        )
+
         # If no valid credentials, authenticate
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
+        if not creds or not creds.valid or expiring_soon:
+            if creds and (creds.expired or expiring_soon) and creds.refresh_token:
                 # Refresh expired token
-                print("Refreshing expired token...")
+                logger.info("Refreshing expired token")
                 creds.refresh(Request())
             else:
                 # Run OAuth flow for new authentication
@@ -123,16 +198,33 @@ class GoogleSheetsClient:
             # Save credentials for next run
             with open(self.token_file, 'w') as token:
                 token.write(creds.to_json())
-            print(f"Token saved to {self.token_file}")
+            logger.info("Token saved to %s", self.token_file)
 
         # Build the service
-        self.service = build('sheets', 'v4', credentials=creds)
-        print("Successfully authenticated with Google Sheets API")
+        self.service = build('sheets', 'v4', credentials=creds, static_discovery=True)
+        logger.info("Authenticated with Google Sheets API")
+
+    def _invalidate_cache(self) -> None:
+        """Mark the cached restaurant list stale after a write."""
+        self._cache_dirty = True
+
+    def _store_cache(self, restaurants: List[Dict[str, Any]]) -> None:
+        """Remember a fresh get_all_restaurants result."""
+        self._restaurant_cache = restaurants
+        self._restaurant_cache_time = time.monotonic()
+        self._cache_dirty = False
 
-    def get_all_restaurants(self) -> List[Dict[str, Any]]:
+    def get_all_restaurants(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Retrieve all restaurants from the spreadsheet.
 
+        Repeated calls return the last result from memory until a write goes
+        through this client or READ_CACHE_SECONDS elapse. Each call returns
+        fresh copies of the row dicts, so callers may mutate them freely.
+
+        Args:
+            refresh: Bypass the in-memory cache and re-read the sheet
+
         Returns:
             List of dictionaries, each containing restaurant data with keys:
             - name
@@ -152,55 +244,116 @@ class GoogleSheetsClient:
         Raises:
             HttpError: If API request fails
         """
+        if (
+            not refresh
+            and not self._cache_dirty
+            and time.monotonic() - self._restaurant_cache_time < READ_CACHE_SECONDS
+        ):
+            return [dict(r) for r in self._restaurant_cache]
+
         try:
             # Read from row 2 onwards (skip header)
             range_name = f"{self.sheet_name}!A2:M"
 
-            result = self.service.spreadsheets().values().get(
+            result = _execute_with_retry(self.service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
+                range=range_name,
+                fields='values'
+            ))
 
             values = result.get('values', [])
 
             if not values:
-                print("No restaurants found in spreadsheet")
+                logger.info("No restaurants found in spreadsheet")
+                self._store_cache([])
                 return []
 
-            # Convert rows to dictionaries
-            restaurants = []
-            for row in values:
-                # Pad row with empty strings if columns are missing
-                row = row + [''] * (13 - len(row))
-
-                restaurant = {
-                    'name': row[0],
-                    'booking_website': row[1],
-                    'description': row[2],
-                    'priority_reasons': row[3],
-                    'price_range': row[4],
-                    'cuisine_type': row[5],
-                    'eater_dc_rank': float(row[6]) if row[6] else 0.0,
-                    'michelin_guide_rank': float(row[7]) if row[7] else 0.0,
-                    'washington_post_rank': float(row[8]) if row[8] else 0.0,
-                    'washingtonian_rank': float(row[9]) if row[9] else 0.0,
-                    'infatuation_rank': float(row[10]) if row[10] else 0.0,
-                    'priority_rank': float(row[11]) if row[11] else 0.0,
-                    'date_added': row[12]
-                }
-                restaurants.append(restaurant)
+            restaurants = self._rows_to_restaurants(values)
 
-            print(f"Retrieved {len(restaurants)} restaurants from spreadsheet")
-            return restaurants
+            logger.info("Retrieved %d restaurants from spreadsheet", len(restaurants))
+            self._store_cache(restaurants)
+            return [dict(r) for r in restaurants]
 
         except HttpError as error:
-            print(f"An error occurred: {error}")
+            logger.error("Failed to read restaurants: %s", error)
             raise
 
+    def iter_restaurants(self, chunk_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Yield restaurants from the spreadsheet, reading chunk_size rows per request.
+
+        Keeps memory flat for very large sheets. Reading stops at the first
+        window with no values; cleared rows inside a window don't end it early.
+
+        Args:
+            chunk_size: Rows fetched per API call
+
+        Yields:
+            Restaurant dictionaries (see get_all_restaurants)
+
+        Raises:
+            HttpError: If API request fails
+        """
+        start = 2
+        while True:
+            result = _execute_with_retry(self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{self.sheet_name}!A{start}:M{start + chunk_size - 1}",
+                majorDimension='ROWS',
+                fields='values'
+            ))
+
+            values = result.get('values', [])
+            if not values:
+                return
+
+            yield from self._rows_to_restaurants(values)
+            start += chunk_size
+
+    def _rows_to_restaurants(self, values: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert raw data rows (A:M, header excluded) to restaurant dictionaries.
+
+        Args:
+            values: Row values as returned by the Sheets API
+
+        Returns:
+            List of restaurant dictionaries (see get_all_restaurants)
+        """
+        return [restaurant_from_sheets_row(row) for row in values]
+
+    def _prime_sheet(self) -> List[Any]:
+        """
+        Read the header row and all data rows in one batchGet call.
+
+        The data rows populate the get_all_restaurants cache, so a following
+        get_all_restaurants() needs no further request.
+
+        Returns:
+            The header row values (empty list if row 1 is empty)
+
+        Raises:
+            HttpError: If API request fails
+        """
+        result = _execute_with_retry(self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=[f"{self.sheet_name}!A1:M1", f"{self.sheet_name}!A2:M"],
+            fields='valueRanges(range,values)'
+        ))
+
+        header_range, data_range = result.get('valueRanges', [{}, {}])
+        self._store_cache(self._rows_to_restaurants(data_range.get('values', [])))
+
+        header_values = header_range.get('values', [])
+        return header_values[0] if header_values else []
+
     def add_restaurant(self, restaurant: Dict[str, Any]) -> bool:
         """
         Add a new restaurant to the spreadsheet.
 
+        Inside batched(), the row is queued and appended together with the
+        other queued rows instead of in its own API call.
+
         Args:
             restaurant: Dictionary containing restaurant data with keys:
                 - name (required)
@@ -232,41 +385,100 @@ class GoogleSheetsClient:
             restaurant['date_added'] = datetime.now().strftime('%Y-%m-%d')
 
         # Build row data in correct column order (13 columns)
-        row = [
-            restaurant.get('name', ''),
-            restaurant.get('booking_website', ''),
-            restaurant.get('description', ''),
-            restaurant.get('priority_reasons', ''),
-            restaurant.get('price_range', ''),
-            restaurant.get('cuisine_type', ''),
-            restaurant.get('eater_dc_rank', 0.0),
-            restaurant.get('michelin_guide_rank', 0.0),
-            restaurant.get('washington_post_rank', 0.0),
-            restaurant.get('washingtonian_rank', 0.0),
-            restaurant.get('infatuation_rank', 0.0),
-            restaurant.get('priority_rank', 0.0),
-            restaurant.get('date_added', '')
-        ]
+        row = self._restaurant_to_row(restaurant)
 
-        try:
-            values = [row]
-            body = {'values': values}
+        self._pending_rows.append(row)
 
-            result = self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.sheet_name}!A:M",
-                valueInputOption='USER_ENTERED',
-                body=body
-            ).execute()
+        if self._batching and len(self._pending_rows) < self.BATCH_SIZE:
+            logger.debug("Queued restaurant: %s", restaurant['name'])
+            return True
 
-            print(f"Added restaurant: {restaurant['name']}")
-            print(f"Updated cells: {result.get('updates').get('updatedCells')}")
+        try:
+            self.flush()
             return True
 
         except HttpError as error:
-            print(f"An error occurred while adding restaurant: {error}")
+            # Outside batched() the caller owns the retry; don't resend this row later
+            if not self._batching:
+                self._pending_rows.clear()
+            logger.error("Failed to add restaurant %s: %s", restaurant['name'], error)
             raise
 
+    def _restaurant_to_row(self, restaurant: Dict[str, Any]) -> List[Any]:
+        """Build a sheet row (A:M) from a restaurant dict, filling in defaults."""
+        return [restaurant.get(key, default) for key, default in self._ROW_DEFAULTS.items()]
+
+    def flush(self) -> None:
+        """
+        Append all rows queued by add_restaurant in a single API call.
+
+        Rows stay queued if the request fails (add_restaurant drops its row
+        again when called outside batched()).
+
+        Raises:
+            HttpError: If API request fails
+        """
+        if not self._pending_rows:
+            return
+
+        result = self._append_rows(self._pending_rows)
+        logger.info(
+            "Added %d restaurants (%s cells)",
+            len(self._pending_rows), result.get('updates', {}).get('updatedCells')
+        )
+        self._pending_rows = []
+
+    @contextmanager
+    def batched(self) -> Iterator['GoogleSheetsClient']:
+        """
+        Queue add_restaurant calls and write them together on exit.
+
+        Usage:
+            with client.batched():
+                for restaurant in restaurants:
+                    client.add_restaurant(restaurant)
+
+        Queued rows are also flushed whenever BATCH_SIZE is reached. Remaining
+        rows are only written when the block exits cleanly; if it raises, the
+        outermost batched() drops the unwritten rows and re-raises the
+        original error, so a partial batch is never written on the way out.
+        """
+        was_batching = self._batching
+        self._batching = True
+        try:
+            yield self
+        except BaseException:
+            self._batching = was_batching
+            if not was_batching:
+                self._pending_rows = []
+            raise
+        else:
+            self._batching = was_batching
+            if not was_batching:
+                self.flush()
+
+    def _append_rows(self, rows: List[List[Any]]) -> Dict[str, Any]:
+        """
+        Append rows after the last row of the sheet in one values.append call.
+
+        Args:
+            rows: Row values in column order
+
+        Returns:
+            The append response
+        """
+        result = _execute_with_retry(self.service.spreadsheets().values().append(
+            spreadsheetId=self.spreadsheet_id,
+            range=f"{self.sheet_name}!A:M",
+            valueInputOption='USER_ENTERED',
+            insertDataOption='INSERT_ROWS',
+            body={'values': rows},
+            fields='updates/updatedCells'
+        ))
+
+        self._invalidate_cache()
+        return result
+
     def add_multiple_restaurants(self, restaurants: List[Dict[str, Any]]) -> bool:
         """
         Add multiple restaurants to the spreadsheet in a single API call.
@@ -281,48 +493,30 @@ class GoogleSheetsClient:
             HttpError: If API request fails
         """
         if not restaurants:
-            print("No restaurants to add")
+            logger.info("No restaurants to add")
             return True
 
+        today = datetime.now().strftime('%Y-%m-%d')
+
         rows = []
         for restaurant in restaurants:
             # Auto-generate date_added if not provided
             if not restaurant.get('date_added'):
-                restaurant['date_added'] = datetime.now().strftime('%Y-%m-%d')
-
-            row = [
-                restaurant.get('name', ''),
-                restaurant.get('booking_website', ''),
-                restaurant.get('description', ''),
-                restaurant.get('priority_reasons', ''),
-                restaurant.get('price_range', ''),
-                restaurant.get('cuisine_type', ''),
-                restaurant.get('eater_dc_rank', 0.0),
-                restaurant.get('michelin_guide_rank', 0.0),
-                restaurant.get('washington_post_rank', 0.0),
-                restaurant.get('washingtonian_rank', 0.0),
-                restaurant.get('infatuation_rank', 0.0),
-                restaurant.get('priority_rank', 0.0),
-                restaurant.get('date_added', '')
-            ]
-            rows.append(row)
+                restaurant['date_added'] = today
 
-        try:
-            body = {'values': rows}
+            rows.append(self._restaurant_to_row(restaurant))
 
-            result = self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.sheet_name}!A:M",
-                valueInputOption='USER_ENTERED',
-                body=body
-            ).execute()
+        try:
+            result = self._append_rows(rows)
 
-            print(f"Added {len(restaurants)} restaurants")
-            print(f"Updated cells: {result.get('updates').get('updatedCells')}")
+            logger.info(
+                "Added %d restaurants (%s cells)",
+                len(restaurants), result.get('updates', {}).get('updatedCells')
+            )
             return True
 
         except HttpError as error:
-            print(f"An error occurred while adding restaurants: {error}")
+            logger.error("Failed to add restaurants: %s", error)
             raise
 
     def update_restaurant(
@@ -347,42 +541,111 @@ class GoogleSheetsClient:
             raise ValueError("row_number must be 2 or greater (row 1 is header)")
 
         try:
-            # Build update requests for each field
-            updates = []
+            update = self._row_value_range(row_number, restaurant)
 
-            for field, column in self.COLUMNS.items():
-                if field in restaurant:
-                    range_name = f"{self.sheet_name}!{column}{row_number}"
-                    value = restaurant[field]
+            if not update:
+                logger.info("No fields to update")
+                return True
 
-                    updates.append({
-                        'range': range_name,
-                        'values': [[value]]
-                    })
+            # One contiguous range covering every provided field
+            result = _execute_with_retry(self.service.spreadsheets().values().update(
+                spreadsheetId=self.spreadsheet_id,
+                range=update['range'],
+                valueInputOption='USER_ENTERED',
+                body={'values': update['values']},
+                fields='updatedCells'
+            ))
 
-            if not updates:
-                print("No fields to update")
-                return True
+            self._invalidate_cache()
+            logger.info("Updated restaurant at row %d (%s cells)", row_number, result.get('updatedCells'))
+            return True
 
-            # Batch update all fields
-            body = {
-                'valueInputOption': 'USER_ENTERED',
-                'data': updates
-            }
+        except HttpError as error:
+            logger.error("Failed to update restaurant at row %d: %s", row_number, error)
+            raise
 
-            result = self.service.spreadsheets().values().batchUpdate(
-                spreadsheetId=self.spreadsheet_id,
-                body=body
-            ).execute()
+    def update_restaurants(self, updates: Dict[int, Dict[str, Any]]) -> bool:
+        """
+        Update several restaurants in one values.batchUpdate call.
+
+        Args:
+            updates: Mapping of row number (2 = first data row) to the fields
+                to update in that row (only provided fields are updated)
+
+        Returns:
+            True if successful, False otherwise
+
+        Raises:
+            ValueError: If any row number points at the header
+            HttpError: If API request fails
+        """
+        if any(row_number < 2 for row_number in updates):
+            raise ValueError("row_number must be 2 or greater (row 1 is header)")
 
-            print(f"Updated restaurant at row {row_number}")
-            print(f"Updated cells: {result.get('totalUpdatedCells')}")
+        # One contiguous range per row
+        data = [
+            update
+            for row_number, restaurant in updates.items()
+            if (update := self._row_value_range(row_number, restaurant))
+        ]
+
+        if not data:
+            logger.info("No fields to update")
+            return True
+
+        try:
+            result = _execute_with_retry(self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={'valueInputOption': 'USER_ENTERED', 'data': data},
+                fields='totalUpdatedCells'
+            ))
+
+            self._invalidate_cache()
+            logger.info(
+                "Updated %d restaurants (%s cells)",
+                len(data), result.get('totalUpdatedCells')
+            )
             return True
 
         except HttpError as error:
-            print(f"An error occurred while updating restaurant: {error}")
+            logger.error("Failed to update restaurants: %s", error)
             raise
 
+    def _row_value_range(
+        self,
+        row_number: int,
+        restaurant: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a single ValueRange spanning the provided fields of one row.
+
+        Columns between the first and last provided field are sent as None,
+        which the Sheets API skips, so only the provided cells change.
+
+        Args:
+            row_number: The row number to update
+            restaurant: Dictionary with fields to update
+
+        Returns:
+            Dict with 'range' and 'values', or None if no known fields were given
+        """
+        # Walk only the provided fields (usually a few) rather than every column
+        cells = {}
+        for field, value in restaurant.items():
+            index = self._COLUMN_INDEX.get(field)
+            if index is not None:
+                cells[index] = value
+        if not cells:
+            return None
+
+        first, last = min(cells), max(cells)
+        first_column, last_column = chr(ord('A') + first), chr(ord('A') + last)
+
+        return {
+            'range': f"{self.sheet_name}!{first_column}{row_number}:{last_column}{row_number}",
+            'values': [[cells.get(i) for i in range(first, last + 1)]]
+        }
+
     def delete_restaurant(self, row_number: int) -> bool:
         """
         Delete a restaurant from the spreadsheet by clearing the row.
@@ -399,61 +662,165 @@ class GoogleSheetsClient:
         Raises:
             HttpError: If API request fails
         """
-        if row_number < 2:
+        return self.delete_restaurants([row_number])
+
+    def delete_restaurants(self, row_numbers: List[int]) -> bool:
+        """
+        Delete several restaurants by clearing their rows in one API call.
+
+        Like delete_restaurant, rows are cleared rather than removed.
+
+        Args:
+            row_numbers: Row numbers to delete (2 = first data row after header)
+
+        Returns:
+            True if successful, False otherwise
+
+        Raises:
+            ValueError: If any row number points at the header
+            HttpError: If API request fails
+        """
+        if any(row_number < 2 for row_number in row_numbers):
             raise ValueError("row_number must be 2 or greater (row 1 is header)")
 
+        if not row_numbers:
+            logger.info("No restaurants to delete")
+            return True
+
         try:
-            range_name = f"{self.sheet_name}!A{row_number}:N{row_number}"
+            ranges = [f"{self.sheet_name}!A{row_number}:N{row_number}" for row_number in row_numbers]
 
-            result = self.service.spreadsheets().values().clear(
+            _execute_with_retry(self.service.spreadsheets().values().batchClear(
                 spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
+                body={'ranges': ranges},
+                fields='spreadsheetId'
+            ))
 
-            print(f"Deleted restaurant at row {row_number}")
+            self._invalidate_cache()
+            logger.info("Deleted restaurants at rows %s", row_numbers)
             return True
 
         except HttpError as error:
-            print(f"An error occurred while deleting restaurant: {error}")
+            logger.error("Failed to delete restaurants: %s", error)
             raise
 
-    def initialize_spreadsheet(self) -> bool:
+    def _get_sheet_id(self) -> int:
+        """
+        Look up the numeric sheetId of the configured sheet tab.
+
+        Returns:
+            The sheetId used by spreadsheets.batchUpdate requests
+
+        Raises:
+            ValueError: If no tab is named sheet_name
+            HttpError: If API request fails
+        """
+        result = _execute_with_retry(self.service.spreadsheets().get(
+            spreadsheetId=self.spreadsheet_id,
+            fields='sheets.properties(sheetId,title)'
+        ))
+
+        for sheet in result.get('sheets', []):
+            properties = sheet.get('properties', {})
+            if properties.get('title') == self.sheet_name:
+                return properties.get('sheetId', 0)
+
+        raise ValueError(f"Sheet '{self.sheet_name}' not found in spreadsheet")
+
+    def _init_marker_path(self) -> Path:
+        """Marker file recording that this spreadsheet tab has headers."""
+        sheet_key = get_cache_key(f"{self.spreadsheet_id}|{self.sheet_name}")
+        return Config.STATE_DIR / 'sheets' / f"initialized_{sheet_key}.json"
+
+    def _mark_initialized(self) -> None:
+        """Write the initialization marker file (a small JSON stamp)."""
+        marker = self._init_marker_path()
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(json.dumps({
+            'spreadsheet_id': self.spreadsheet_id,
+            'sheet_name': self.sheet_name,
+            'initialized_at': time.time()
+        }))
+
+    def initialize_spreadsheet(self, force: bool = False) -> bool:
         """
         Initialize the spreadsheet with headers if empty.
 
-        Checks if row 1 exists and adds headers if not present.
+        Checks if row 1 exists and adds headers if not present. The check
+        reads the data rows in the same request, priming get_all_restaurants.
+        Missing headers are written, bolded, and frozen in one batchUpdate.
+
+        Once headers are known to exist, a marker file under
+        Config.STATE_DIR lets later runs skip the check entirely (pass
+        force=True to check again).
+
+        Args:
+            force: Re-check the sheet even if the marker file exists
 
         Returns:
             True if headers were added or already exist, False otherwise
         """
+        if not force and self._init_marker_path().exists():
+            return True
+
         try:
             # Check if headers exist
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.sheet_name}!A1:N1"
-            ).execute()
-
-            values = result.get('values', [])
+            header = self._prime_sheet()
 
-            if values and len(values[0]) == 14:
-                print("Headers already exist")
+            if len(header) == len(self.HEADER_ROW):
+                logger.info("Headers already exist")
+                self._mark_initialized()
                 return True
 
-            # Add headers
-            body = {'values': [self.HEADER_ROW]}
+            # Write, bold, and freeze the header row in one batchUpdate
+            sheet_id = self._get_sheet_id()
+            header_range = {
+                'sheetId': sheet_id,
+                'startRowIndex': 0,
+                'endRowIndex': 1,
+                'startColumnIndex': 0,
+                'endColumnIndex': len(self.HEADER_ROW)
+            }
+            requests = [
+                {
+                    'updateCells': {
+                        'range': header_range,
+                        'rows': [{
+                            'values': [
+                                {'userEnteredValue': {'stringValue': title}}
+                                for title in self.HEADER_ROW
+                            ]
+                        }],
+                        'fields': 'userEnteredValue'
+                    }
+                },
+                {
+                    'repeatCell': {
+                        'range': header_range,
+                        'cell': {'userEnteredFormat': {'textFormat': {'bold': True}}},
+                        'fields': 'userEnteredFormat.textFormat.bold'
+                    }
+                },
+                {
+                    'updateSheetProperties': {
+                        'properties': {'sheetId': sheet_id, 'gridProperties': {'frozenRowCount': 1}},
+                        'fields': 'gridProperties.frozenRowCount'
+                    }
+                }
+            ]
 
-            self.service.spreadsheets().values().update(
+            _execute_with_retry(self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
-                range=f"{self.sheet_name}!A1:N1",
-                valueInputOption='RAW',
-                body=body
-            ).execute()
+                body={'requests': requests},
+                fields='spreadsheetId'
+            ))
 
-            print("Added headers to spreadsheet")
+            logger.info("Added headers to spreadsheet")
+            self._mark_initialized()
             return True
 
         except HttpError as error:
-            print(f"An error occurred while initializing spreadsheet: {error}")
+            logger.error("Failed to initialize spreadsheet: %s", error)
             raise
 
 
@@ -461,6 +828,8 @@ def main():
     """
     Example usage and testing of GoogleSheetsClient
     """
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     try:
         # Initialize client
         print("Initializing Google Sheets client...")
@@ -0,0 +1,115 @@
+"""
+Rate-limited Tavily client for restaurant discovery.
+
+Discovery fans Tavily requests out across several thread pools at once
+(known URLs, source searches, deep crawls, price lookups). This wrapper
+caps the request rate and the number of requests in flight so a
+constrained Tavily plan doesn't answer the burst with HTTP 429s.
+
+Configuration via environment variables:
+- TAVILY_RPS=5: Sustained requests per second (bursts up to 2x)
+- TAVILY_MAX_IN_FLIGHT=8: Max concurrent Tavily requests
+"""
+
+import os
+import threading
+import time
+from typing import Any, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `burst`; each
+    acquire() takes one token, sleeping until one is available.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held at once
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_seconds = (1 - self._tokens) / self.rate
+
+            time.sleep(wait_seconds)
+
+
+class RateLimitedTavilyClient:
+    """
+    TavilyClient wrapper that rate-limits search, extract, crawl, and map calls.
+
+    Every call waits for a token from a shared TokenBucket and holds a slot in
+    a bounded semaphore for its duration.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        requests_per_second: Optional[float] = None,
+        max_in_flight: Optional[int] = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: Tavily API key
+            requests_per_second: Sustained request rate (default: TAVILY_RPS or 5)
+            max_in_flight: Max concurrent requests (default: TAVILY_MAX_IN_FLIGHT or 8)
+        """
+        from tavily import TavilyClient
+
+        if requests_per_second is None:
+            requests_per_second = float(os.getenv('TAVILY_RPS', '5'))
+        if max_in_flight is None:
+            max_in_flight = int(os.getenv('TAVILY_MAX_IN_FLIGHT', '8'))
+
+        self._client = TavilyClient(api_key=api_key)
+        self._bucket = TokenBucket(
+            rate=requests_per_second,
+            burst=max(1, int(requests_per_second * 2))
+        )
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        """Run a TavilyClient method under the in-flight cap and rate limit."""
+        with self._in_flight:
+            self._bucket.acquire()
+            return getattr(self._client, method)(*args, **kwargs)
+
+    def search(self, *args, **kwargs) -> Any:
+        """Rate-limited TavilyClient.search."""
+        return self._call('search', *args, **kwargs)
+
+    def extract(self, *args, **kwargs) -> Any:
+        """Rate-limited TavilyClient.extract."""
+        return self._call('extract', *args, **kwargs)
+
+    def crawl(self, *args, **kwargs) -> Any:
+        """Rate-limited TavilyClient.crawl."""
+        return self._call('crawl', *args, **kwargs)
+
+    def map(self, *args, **kwargs) -> Any:
+        """Rate-limited TavilyClient.map."""
+        return self._call('map', *args, **kwargs)
@@ -9,6 +9,7 @@ import re
 import argparse
 from pathlib import Path
 from datetime import datetime
+from typing import Any
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -16,58 +17,57 @@ sys.path.insert(0, str(Path(__file__).parent))
 from utils.config import Config
 from utils.logger import setup_logger
 from utils.cache import clear_cache, get_cache_stats
-from clients.google_sheets_client import GoogleSheetsClient
-from agents.restaurant_list_agent import build_restaurant_list_graph, RestaurantListState
-
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.types import Command
 
 logger = setup_logger(__name__)
 
+# User approval vocabulary and number pattern, built once
+_FULL_APPROVAL = frozenset({"yes", "y", "approve", "looks good", "add all", "add them", "ok"})
+_REJECT = frozenset({"no", "n", "cancel", "skip", "don't add", "nope"})
+_NUM_RE = re.compile(r'\d+')
+
 
 # ============================================================================
 # CLI Helper Functions
 # ============================================================================
 
-def parse_user_approval(user_input: str) -> tuple[bool, str]:
+def parse_user_approval(user_input: str) -> tuple[bool, str, Any]:
     """
-    Parse user approval input into (approval: bool, feedback: str).
+    Parse user approval input into (approval, tag, payload).
 
     Examples:
-    - "yes" → (True, "")
-    - "no" → (False, "")
-    - "Add 1, 3, 5" → (True, "partial: [1, 3, 5]")
-    - "Tell me more about #2" → (False, "more_info: 2")
+    - "yes" → (True, "ok", None)
+    - "no" → (False, "cancelled", None)
+    - "Add 1, 3, 5" → (True, "partial", [1, 3, 5])
+    - "Tell me more about #2" → (False, "more_info", 2)
+    - anything else → (False, "unclear", None)
     """
     user_input_lower = user_input.lower().strip()
 
     # Full approval
-    if user_input_lower in ["yes", "y", "approve", "looks good", "add all", "add them", "ok"]:
-        return (True, "")
+    if user_input_lower in _FULL_APPROVAL:
+        return (True, "ok", None)
 
     # Rejection
-    if user_input_lower in ["no", "n", "cancel", "skip", "don't add", "nope"]:
-        return (False, "cancelled")
+    if user_input_lower in _REJECT:
+        return (False, "cancelled", None)
 
-    # Partial approval: "Add 1, 3, 5" or "Add restaurants 1 and 3"
-    if "add" in user_input_lower:
-        numbers = extract_numbers_from_text(user_input)
-        if numbers:
-            return (True, f"partial: {numbers}")
+    numbers = extract_numbers_from_text(user_input)
+    if numbers:
+        # Partial approval: "Add 1, 3, 5" or "Add restaurants 1 and 3"
+        if "add" in user_input_lower:
+            return (True, "partial", numbers)
 
-    # Request for more info: "Tell me more about #2"
-    if "more" in user_input_lower or "tell me" in user_input_lower:
-        numbers = extract_numbers_from_text(user_input)
-        if numbers:
-            return (False, f"more_info: {numbers[0]}")
+        # Request for more info: "Tell me more about #2"
+        if "more" in user_input_lower or "tell me" in user_input_lower:
+            return (False, "more_info", numbers[0])
 
     # Default: treat as rejection and ask for clarification
-    return (False, "unclear")
+    return (False, "unclear", None)
 
 
 def extract_numbers_from_text(text: str) -> list[int]:
     """Extract numbers from text like 'Add 1, 3, 5' → [1, 3, 5]"""
-    return [int(n) for n in re.findall(r'\d+', text)]
+    return [int(n) for n in _NUM_RE.findall(text)]
 
 
 def format_startup_message() -> str:
@@ -114,6 +114,15 @@ def run_restaurant_list_cli():
     """
     Main CLI chat loop for RestaurantList agent.
     """
+    # Imported here so --clear-cache / --cache-stats don't load the agent,
+    # LangGraph, OpenAI, and Google API client stacks
+    from agents.restaurant_list_agent import (
+        build_restaurant_list_graph,
+        update_google_sheet,
+        RestaurantListState,
+    )
+    from langgraph.checkpoint.memory import MemorySaver
+
     print(format_startup_message())
 
     # Build LangGraph WITHOUT interrupts - we'll handle approval manually
@@ -128,6 +137,7 @@ def run_restaurant_list_cli():
         "user_action": "",
         "discovered_restaurants": [],
         "current_list": [],
+        "current_name_index": {},
         "restaurants_to_add": [],
         "restaurants_to_remove": [],
         "recommendation_message": "",
@@ -156,7 +166,7 @@ def run_restaurant_list_cli():
             if not user_input:
                 continue
 
-            logger.info(f"User input: {user_input}")
+            logger.info("User input: %s", user_input)
 
             # Update state
             state["user_message"] = user_input
@@ -176,10 +186,10 @@ def run_restaurant_list_cli():
                 if result.get("restaurants_to_add") and len(result.get("restaurants_to_add", [])) > 0:
                     # Wait for user approval
                     approval_input = input("\nYou: ").strip()
-                    logger.info(f"User approval input: {approval_input}")
+                    logger.info("User approval input: %s", approval_input)
 
                     # Parse approval
-                    approval, feedback = parse_user_approval(approval_input)
+                    approval, feedback, payload = parse_user_approval(approval_input)
 
                     # Handle unclear responses
                     if feedback == "unclear":
@@ -190,17 +200,15 @@ def run_restaurant_list_cli():
                         continue
 
                     # Handle "more info" requests
-                    if feedback.startswith("more_info:"):
-                        restaurant_num = int(feedback.split(":")[1])
+                    if feedback == "more_info":
+                        restaurant_num = payload
                         if restaurant_num <= len(result['restaurants_to_add']):
                             print(f"\n{display_restaurant_details(result['restaurants_to_add'][restaurant_num - 1])}")
                         continue
 
                     # Handle partial approval
-                    if feedback.startswith("partial:"):
-                        # Extract restaurant numbers
-                        import ast
-                        numbers = ast.literal_eval(feedback.split(":", 1)[1])
+                    if feedback == "partial":
+                        numbers = payload
                         # Filter restaurants_to_add to only include selected ones
                         selected = [result['restaurants_to_add'][i-1] for i in numbers if i <= len(result['restaurants_to_add'])]
                         result['restaurants_to_add'] = selected
@@ -209,15 +217,13 @@ def run_restaurant_list_cli():
                     # If approved, manually update Google Sheets
                     if approval:
                         num_to_add = len(result['restaurants_to_add'])
-                        print(f"\n[DEBUG] Approval granted - adding {num_to_add} restaurants...")
+                        logger.debug("Approval granted - adding %d restaurants", num_to_add)
 
-                        # Import and call update function directly
-                        from agents.restaurant_list_agent import update_google_sheet
+                        # Call update function directly
                         result['user_approval'] = True
                         result['user_feedback'] = feedback
 
                         # Call the update function
-                        print("[DEBUG] Calling update_google_sheet function...")
                         try:
                             final_result = update_google_sheet(result)
 
@@ -227,7 +233,7 @@ def run_restaurant_list_cli():
                                 print(f"\nAgent: Encountered errors while updating:")
                                 for error in errors:
                                     print(f"  - {error}")
-                                logger.error(f"Errors during update: {errors}")
+                                logger.error("Errors during update: %s", errors)
 
                             # Count successful additions (num_to_add minus errors related to adding)
                             add_errors = [e for e in errors if "Failed to add" in e]
@@ -235,14 +241,14 @@ def run_restaurant_list_cli():
 
                             if num_added > 0:
                                 print(f"\nAgent: Successfully updated your restaurant list! Added {num_added} restaurant{'s' if num_added != 1 else ''}.\n")
-                                logger.info(f"Added {num_added} restaurants to list")
+                                logger.info("Added %d restaurants to list", num_added)
                             elif not errors:
                                 print(f"\nAgent: No restaurants were added.\n")
 
                             state = final_result
                         except Exception as e:
                             print(f"\nAgent: Failed to update Google Sheets: {str(e)}\n")
-                            logger.error(f"Exception in update_google_sheet: {e}", exc_info=True)
+                            logger.exception("Exception in update_google_sheet: %s", e)
                             import traceback
                             traceback.print_exc()
                     else:
@@ -254,7 +260,7 @@ def run_restaurant_list_cli():
                     state = result
 
             except Exception as e:
-                logger.error(f"Error during graph execution: {e}", exc_info=True)
+                logger.exception("Error during graph execution: %s", e)
                 print(f"\nAgent: I encountered an unexpected error: {str(e)}\n")
                 print("Please try again or type 'exit' to quit.\n")
 
@@ -263,7 +269,7 @@ def run_restaurant_list_cli():
         logger.info("User interrupted session with Ctrl+C")
 
     except Exception as e:
-        logger.error(f"Fatal error in CLI loop: {e}", exc_info=True)
+        logger.exception("Fatal error in CLI loop: %s", e)
         print(f"\nFatal error: {str(e)}\n")
         sys.exit(1)
 
@@ -294,8 +300,17 @@ def main():
         help="Show cache statistics and exit"
     )
 
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show Google Sheets client status messages"
+    )
+
     args = parser.parse_args()
 
+    if args.verbose:
+        setup_logger("clients")
+
     # Handle cache commands
     if args.clear_cache:
         print("Clearing API response cache...")
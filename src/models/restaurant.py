@@ -6,6 +6,7 @@ Defines the Restaurant class matching the Google Sheets schema for RestaurantLis
 
 from typing import TypedDict
 from datetime import datetime
+from itertools import chain, repeat
 
 
 class Restaurant(TypedDict):
@@ -31,6 +32,19 @@ class Restaurant(TypedDict):
     date_added: str  # YYYY-MM-DD format
 
 
+# Google Sheets column order (A-M) and the columns stored as floats
+SHEETS_FIELDS = (
+    'name', 'booking_website', 'description', 'priority_reasons',
+    'price_range', 'cuisine_type', 'eater_dc_rank', 'michelin_guide_rank',
+    'washington_post_rank', 'washingtonian_rank', 'infatuation_rank',
+    'priority_rank', 'date_added'
+)
+_FLOAT_FIELDS = SHEETS_FIELDS[6:12]
+
+# Value written for each column (in order) when a restaurant lacks the field
+SHEETS_ROW_DEFAULTS = dict.fromkeys(SHEETS_FIELDS, '') | dict.fromkeys(_FLOAT_FIELDS, 0.0)
+
+
 def create_restaurant(
     name: str,
     booking_website: str = "",
@@ -95,23 +109,9 @@ def restaurant_to_sheets_row(restaurant: Restaurant) -> list:
         restaurant: Restaurant dictionary
 
     Returns:
-        List of values in correct column order for Google Sheets (13 columns)
+        List of values in correct column order for Google Sheets (one per SHEETS_FIELDS)
     """
-    return [
-        restaurant['name'],
-        restaurant['booking_website'],
-        restaurant['description'],
-        restaurant['priority_reasons'],
-        restaurant['price_range'],
-        restaurant['cuisine_type'],
-        restaurant['eater_dc_rank'],
-        restaurant['michelin_guide_rank'],
-        restaurant['washington_post_rank'],
-        restaurant['washingtonian_rank'],
-        restaurant['infatuation_rank'],
-        restaurant['priority_rank'],
-        restaurant['date_added']
-    ]
+    return [restaurant[field] for field in SHEETS_FIELDS]
 
 
 def restaurant_from_sheets_row(row: list) -> Restaurant:
@@ -119,26 +119,14 @@ def restaurant_from_sheets_row(row: list) -> Restaurant:
     Create Restaurant from Google Sheets row.
 
     Args:
-        row: List of values from Google Sheets (13 columns)
+        row: List of values from Google Sheets (one per SHEETS_FIELDS)
 
     Returns:
         Restaurant dictionary
     """
-    # Pad row if needed
-    row = row + [''] * (13 - len(row))
-
-    return Restaurant(
-        name=row[0],
-        booking_website=row[1],
-        description=row[2],
-        priority_reasons=row[3],
-        price_range=row[4],
-        cuisine_type=row[5],
-        eater_dc_rank=float(row[6]) if row[6] else 0.0,
-        michelin_guide_rank=float(row[7]) if row[7] else 0.0,
-        washington_post_rank=float(row[8]) if row[8] else 0.0,
-        washingtonian_rank=float(row[9]) if row[9] else 0.0,
-        infatuation_rank=float(row[10]) if row[10] else 0.0,
-        priority_rank=float(row[11]) if row[11] else 0.0,
-        date_added=row[12]
-    )
+    # Missing trailing columns read as empty strings
+    restaurant = dict(zip(SHEETS_FIELDS, chain(row, repeat(''))))
+    for field in _FLOAT_FIELDS:
+        value = restaurant[field]
+        restaurant[field] = float(value) if value else 0.0
+    return restaurant
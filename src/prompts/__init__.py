@@ -18,6 +18,7 @@ from prompts.extraction import (
 
 from prompts.ranking import (
     priority_reasons_prompt,
+    priority_reasons_batch_prompt,
 )
 
 from prompts.editing import (
@@ -30,6 +31,7 @@ __all__ = [
     "price_enrichment_prompt",
     # Ranking (priority reasons only - source ranking is in extraction)
     "priority_reasons_prompt",
+    "priority_reasons_batch_prompt",
     # Editing
     "edit_command_prompt",
 ]
@@ -8,20 +8,9 @@ EDIT_COMMAND_SYSTEM = (
     "requests into structured actions."
 )
 
-
-def edit_command_prompt(user_message: str) -> str:
-    """
-    Generate prompt for parsing natural language edit commands.
-
-    Args:
-        user_message: The user's edit command in natural language
-
-    Returns:
-        Formatted prompt string
-    """
-    return f"""Parse this user command into a structured action:
-
-USER COMMAND: "{user_message}"
+# Static instructions placed before the user command so all calls share a
+# byte-identical prompt prefix (server-side prompt caching)
+EDIT_COMMAND_INSTRUCTIONS = """Parse the user command at the end of this message into a structured action.
 
 Possible actions:
 - "remove": User wants to remove a restaurant
@@ -35,9 +24,24 @@ Extract:
 4. New value (if applicable)
 
 Respond in JSON format:
-{{
+{
   "action": "remove",
   "restaurant_name": "Restaurant X",
   "field": null,
   "new_value": null
-}}"""
+}"""
+
+
+def edit_command_prompt(user_message: str) -> str:
+    """
+    Generate prompt for parsing natural language edit commands.
+
+    Args:
+        user_message: The user's edit command in natural language
+
+    Returns:
+        Formatted prompt string
+    """
+    return f"""{EDIT_COMMAND_INSTRUCTIONS}
+
+USER COMMAND: \"{user_message}\""""
@@ -2,6 +2,8 @@
 Prompts for extracting restaurant data from web content.
 """
 
+from typing import Any, Dict, List
+
 # System prompt for restaurant extraction and ranking
 RESTAURANT_EXTRACTION_SYSTEM = (
     "You are a restaurant data extraction and ranking assistant. Your job is to parse web "
@@ -11,32 +13,18 @@ RESTAURANT_EXTRACTION_SYSTEM = (
 
 # System prompt for price enrichment
 PRICE_ENRICHMENT_SYSTEM = (
-    "You are a restaurant price analyst. Extract the price tier from search results."
+    "You are a restaurant price analyst. Extract the price tier for each restaurant "
+    "from its search results and respond in JSON."
 )
 
 
-def restaurant_extraction_prompt(
-    source: str,
-    location: str,
-    content: str,
-    chunk_label: str = ""
-) -> str:
-    """
-    Generate prompt for extracting and ranking restaurants from web content.
-
-    Args:
-        source: Name of the source (e.g., "Eater DC", "Michelin Guide")
-        location: City/region for filtering (e.g., "Washington DC")
-        content: Raw web content to extract from
-        chunk_label: Optional label for chunked content (e.g., "(chunk 1/3)")
-
-    Returns:
-        Formatted prompt string
-    """
-    return f"""I found content from {source}{chunk_label}. Extract and rank restaurants that are PRIMARY FEATURED ENTRIES in this content.
+# Static extraction instructions. Kept free of per-call values so every
+# extraction request shares a byte-identical prompt prefix (server-side
+# prompt caching); source, location, and content are appended last.
+RESTAURANT_EXTRACTION_INSTRUCTIONS = """Extract and rank restaurants that are PRIMARY FEATURED ENTRIES in the source content at the end of this message.
 
 GUIDELINES:
-- Location: {location} area (include nearby suburbs)
+- Location: the LOCATION given below (include nearby suburbs)
 - ONLY extract restaurants that are FEATURED ENTRIES in the list (have their own dedicated section/write-up)
 - Include restaurants of any price range (we'll filter later)
 - Do NOT skip restaurants because they seem casual - if they're a featured entry, include them
@@ -55,9 +43,6 @@ Look for structural indicators of featured entries:
 
 If a restaurant is just a passing mention (e.g., "the team also runs X"), do NOT include it.
 
-SOURCE CONTENT:
-{content}
-
 For each restaurant that meets the criteria, extract AND RANK:
 
 1. Restaurant name (official name)
@@ -97,9 +82,9 @@ For each restaurant that meets the criteria, extract AND RANK:
 7. Ranking reason (1 brief sentence explaining the rank based on position/prominence in this source)
 
 Respond in JSON format with this exact structure:
-{{
+{
   "restaurants": [
-    {{
+    {
       "name": "Restaurant Name",
       "description": "Brief description...",
       "cuisine_type": "Italian",
@@ -107,33 +92,42 @@ Respond in JSON format with this exact structure:
       "booking_website": "https://...",
       "source_rank": 4.5,
       "ranking_reason": "Featured as #3 on Essential 38 list with glowing review"
-    }}
+    }
   ]
-}}
+}
 
-If no restaurants meet the criteria, return {{"restaurants": []}}."""
+If no restaurants meet the criteria, return {"restaurants": []}."""
 
 
-def price_enrichment_prompt(
-    restaurant_name: str,
+def restaurant_extraction_prompt(
+    source: str,
     location: str,
-    search_content: str
+    content: str,
+    chunk_label: str = ""
 ) -> str:
     """
-    Generate prompt for extracting price tier from search results.
+    Generate prompt for extracting and ranking restaurants from web content.
 
     Args:
-        restaurant_name: Name of the restaurant
-        location: City/region for context
-        search_content: Combined search results content
+        source: Name of the source (e.g., "Eater DC", "Michelin Guide")
+        location: City/region for filtering (e.g., "Washington DC")
+        content: Raw web content to extract from
+        chunk_label: Optional label for chunked content (e.g., "(chunk 1/3)")
 
     Returns:
         Formatted prompt string
     """
-    return f"""Based on the following search results, determine the price range for {restaurant_name} in {location}.
+    return f"""{RESTAURANT_EXTRACTION_INSTRUCTIONS}
 
-SEARCH RESULTS:
-{search_content[:4000]}
+SOURCE: {source}{chunk_label}
+LOCATION: {location} area
+
+SOURCE CONTENT:
+{content}"""
+
+
+# Static price enrichment instructions (shared prompt prefix, see above)
+PRICE_ENRICHMENT_INSTRUCTIONS = """Based on the search results at the end of this message, determine the price range for each restaurant in the LOCATION given below.
 
 Price tiers (per person for dinner with one drink):
 - $: Under $25
@@ -147,5 +141,44 @@ Look for:
 - Tasting menu prices (usually $$$$)
 - Average check or cost per person mentions
 
-Respond with ONLY the price tier symbol ($, $$, $$$, or $$$$).
-If you cannot determine the price, respond with "unknown"."""
+Respond in JSON format with one entry per restaurant id:
+{
+  "prices": [
+    {"id": 0, "price_range": "$$$"}
+  ]
+}
+
+Use only the price tier symbol ($, $$, $$$, or $$$$) for price_range.
+If you cannot determine the price for a restaurant, use "unknown"."""
+
+
+def price_enrichment_prompt(
+    location: str,
+    items: List[Dict[str, Any]],
+    max_content_chars: int = 4000
+) -> str:
+    """
+    Generate prompt for extracting price tiers for a batch of restaurants.
+
+    Args:
+        location: City/region for context
+        items: List of dicts with keys:
+            - id: Integer identifier echoed back in the response
+            - name: Name of the restaurant
+            - search_content: Combined search results content
+        max_content_chars: Max search content characters included per restaurant
+
+    Returns:
+        Formatted prompt string
+    """
+    restaurant_sections = "\n\n".join(
+        f"--- RESTAURANT id={item['id']}: {item['name']} ---\n{item['search_content'][:max_content_chars]}"
+        for item in items
+    )
+
+    return f"""{PRICE_ENRICHMENT_INSTRUCTIONS}
+
+LOCATION: {location}
+
+SEARCH RESULTS:
+{restaurant_sections}"""
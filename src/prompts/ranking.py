@@ -6,12 +6,27 @@ This module now only contains prompts for generating priority reasons after
 rankings have been aggregated.
 """
 
+from typing import Any, Dict, List
+
 # System prompt for priority reasons
 PRIORITY_REASONS_SYSTEM = (
     "You are a concise restaurant recommendation writer. Generate brief, "
     "compelling reasons for why a restaurant is prioritized."
 )
 
+# Static instructions placed before the per-restaurant details so all calls
+# share a byte-identical prompt prefix (server-side prompt caching)
+PRIORITY_REASONS_INSTRUCTIONS = """Generate a brief explanation (1-3 sentences) for why the restaurant at the end of this message is prioritized for an upscale date night list.
+
+Focus on:
+- Notable list placements or awards
+- Standout features (food quality, innovation, ambience, cocktails)
+- Recent recognition or acclaim
+
+Keep it concise and compelling.
+
+Respond with just the text explanation, no JSON."""
+
 
 def priority_reasons_prompt(
     restaurant_name: str,
@@ -31,7 +46,7 @@ def priority_reasons_prompt(
     Returns:
         Formatted prompt string
     """
-    return f"""Generate a brief explanation (1-3 sentences) for why this restaurant is prioritized for an upscale date night list:
+    return f"""{PRIORITY_REASONS_INSTRUCTIONS}
 
 RESTAURANT:
 Name: {restaurant_name}
@@ -39,13 +54,53 @@ Description: {description}
 Overall Ranking: {priority_rank}/5.0
 
 SOURCE RANKINGS:
-{rankings_text}
+{rankings_text}"""
+
+
+# Static instructions for batched priority reasons (shared prompt prefix, see above)
+PRIORITY_REASONS_BATCH_INSTRUCTIONS = """Generate a brief explanation (1-3 sentences) for why EACH restaurant at the end of this message is prioritized for an upscale date night list.
 
 Focus on:
 - Notable list placements or awards
 - Standout features (food quality, innovation, ambience, cocktails)
 - Recent recognition or acclaim
 
-Keep it concise and compelling.
+Keep each explanation concise and compelling, and write it only from that restaurant's details.
 
-Respond with just the text explanation, no JSON."""
+Respond in JSON format with one entry per restaurant id:
+{
+  "reasons": [
+    {"id": 0, "reasons": "Explanation..."}
+  ]
+}"""
+
+
+def priority_reasons_batch_prompt(items: List[Dict[str, Any]]) -> str:
+    """
+    Generate prompt for explaining why each of several restaurants is prioritized.
+
+    Args:
+        items: List of dicts with keys:
+            - id: Integer identifier echoed back in the response
+            - name: Name of the restaurant
+            - description: Restaurant description
+            - priority_rank: Overall priority ranking (1.0-5.0)
+            - rankings_text: Formatted text of source rankings
+
+    Returns:
+        Formatted prompt string
+    """
+    restaurant_sections = "\n\n".join(
+        f"""--- RESTAURANT id={item['id']} ---
+Name: {item['name']}
+Description: {item['description']}
+Overall Ranking: {item['priority_rank']}/5.0
+Source Rankings:
+{item['rankings_text']}"""
+        for item in items
+    )
+
+    return f"""{PRIORITY_REASONS_BATCH_INSTRUCTIONS}
+
+RESTAURANTS:
+{restaurant_sections}"""
@@ -1,12 +1,24 @@
 """
 Utility functions for logging, configuration, and common operations.
+
+Cache helpers are re-exported lazily (PEP 562) so importing utils.config or
+utils.logger doesn't also load the cache module.
 """
 
-from utils.cache import (
-    get_cached,
-    set_cached,
-    clear_cache,
-    get_cache_stats,
-    is_cache_enabled,
-    cached_tavily_call
+_CACHE_EXPORTS = (
+    'get_cached',
+    'set_cached',
+    'clear_cache',
+    'get_cache_stats',
+    'is_cache_enabled',
+    'cached_tavily_call'
 )
+
+__all__ = list(_CACHE_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _CACHE_EXPORTS:
+        from utils import cache
+        return getattr(cache, name)
+    raise AttributeError(f"module 'utils' has no attribute {name!r}")
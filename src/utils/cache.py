@@ -7,30 +7,110 @@ and repeated discovery runs. Cache is enabled by default with 24-hour TTL.
 Configuration via environment variables:
 - DISABLE_CACHE=true: Disable caching entirely
 - CACHE_TTL_HOURS=24: Time-to-live for cached items (default: 24 hours)
+- CACHE_TTL_HOURS_<TYPE>=N: Per-type override, e.g. CACHE_TTL_HOURS_SEARCH=168
+  to keep search snippets for a week or CACHE_TTL_HOURS_MAP=720 for crawl maps
 """
 
 import hashlib
 import json
 import os
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Any, Dict
-from functools import wraps
+from typing import Optional, Any, Dict, List, Set, Tuple
+from functools import lru_cache, wraps
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Cache directory
 CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / 'cache'
 
-# Configuration from environment
+# In-process LRU in front of the disk cache: (cache_type, cache_key) ->
+# (timestamp, serialized entry). Entries are kept serialized so every hit
+# returns a fresh object, just like a disk read, and callers that mutate
+# cached results can't corrupt later hits.
+MEMORY_CACHE_MAX_ENTRIES = 512
+_MEM: 'OrderedDict[Tuple[str, str], Tuple[float, bytes]]' = OrderedDict()
+_MEM_LOCK = threading.Lock()
+
+# Cache subdirectories already created this process (skips a mkdir per write)
+_ENSURED_DIRS: Set[Path] = set()
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a cache entry (compact orjson when available, else stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize a cache entry written by _dumps."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _mem_get(key: Tuple[str, str]) -> Optional[Tuple[float, bytes]]:
+    """Look up an in-memory entry, marking it most recently used."""
+    with _MEM_LOCK:
+        entry = _MEM.get(key)
+        if entry is not None:
+            _MEM.move_to_end(key)
+        return entry
+
+
+def _mem_put(key: Tuple[str, str], timestamp: float, raw: bytes) -> None:
+    """Store an in-memory entry, evicting the least recently used past the cap."""
+    with _MEM_LOCK:
+        _MEM[key] = (timestamp, raw)
+        _MEM.move_to_end(key)
+        if len(_MEM) > MEMORY_CACHE_MAX_ENTRIES:
+            _MEM.popitem(last=False)
+
+
+def _mem_discard(key: Tuple[str, str]) -> None:
+    """Drop an in-memory entry if present."""
+    with _MEM_LOCK:
+        _MEM.pop(key, None)
+
+
+# Configuration from environment. Read once on first use (after .env has been
+# loaded) rather than on every cache hit; call _refresh_env() after changing
+# the variables in-process.
+@lru_cache(maxsize=1)
 def is_cache_enabled() -> bool:
     """Check if caching is enabled (default: True)."""
     return os.getenv('DISABLE_CACHE', '').lower() != 'true'
 
 
-def get_cache_ttl_seconds() -> int:
-    """Get cache TTL in seconds (default: 24 hours)."""
-    hours = int(os.getenv('CACHE_TTL_HOURS', '24'))
-    return hours * 3600
+@lru_cache(maxsize=None)
+def get_cache_ttl_seconds(cache_type: Optional[str] = None) -> int:
+    """
+    Get cache TTL in seconds (default: 24 hours).
+
+    Args:
+        cache_type: Optional cache subdirectory; CACHE_TTL_HOURS_<TYPE> overrides
+            the global TTL for that type
+
+    Returns:
+        TTL in seconds
+    """
+    hours = os.getenv('CACHE_TTL_HOURS', '24')
+    if cache_type:
+        hours = os.getenv(f'CACHE_TTL_HOURS_{cache_type.upper()}', hours)
+    return int(hours) * 3600
+
+
+def _refresh_env() -> None:
+    """Re-read DISABLE_CACHE and CACHE_TTL_HOURS* from the environment."""
+    is_cache_enabled.cache_clear()
+    get_cache_ttl_seconds.cache_clear()
 
 
 def get_cache_key(identifier: str) -> str:
@@ -41,9 +121,9 @@ def get_cache_key(identifier: str) -> str:
         identifier: String to hash (URL, search query, etc.)
 
     Returns:
-        MD5 hash of the identifier
+        128-bit BLAKE2b hex digest of the identifier
     """
-    return hashlib.md5(identifier.encode()).hexdigest()
+    return hashlib.blake2b(identifier.encode(), digest_size=16).hexdigest()
 
 
 def get_cached(identifier: str, cache_type: str = 'default') -> Optional[Any]:
@@ -61,24 +141,37 @@ def get_cached(identifier: str, cache_type: str = 'default') -> Optional[Any]:
         return None
 
     cache_key = get_cache_key(identifier)
+    mem_key = (cache_type, cache_key)
+    ttl_seconds = get_cache_ttl_seconds(cache_type)
+
+    entry = _mem_get(mem_key)
+    if entry is not None:
+        timestamp, raw = entry
+        if time.time() - timestamp <= ttl_seconds:
+            return _loads(raw).get('content')
+        # Expired - fall through so the file is removed too
+        _mem_discard(mem_key)
+
     cache_subdir = CACHE_DIR / cache_type
     cache_file = cache_subdir / f"{cache_key}.json"
 
-    if not cache_file.exists():
-        return None
-
     try:
-        data = json.loads(cache_file.read_text())
+        raw = cache_file.read_bytes()
+        data = _loads(raw)
 
         # Check if expired
-        age_seconds = time.time() - data.get('timestamp', 0)
-        if age_seconds > get_cache_ttl_seconds():
+        timestamp = data.get('timestamp', 0)
+        if time.time() - timestamp > ttl_seconds:
             # Expired - remove the file
             cache_file.unlink(missing_ok=True)
             return None
 
+        _mem_put(mem_key, timestamp, raw)
         return data.get('content')
 
+    except FileNotFoundError:
+        return None
+
     except (json.JSONDecodeError, KeyError, OSError):
         # Corrupted cache file - remove it
         cache_file.unlink(missing_ok=True)
@@ -99,20 +192,64 @@ def set_cached(identifier: str, content: Any, cache_type: str = 'default') -> No
 
     cache_key = get_cache_key(identifier)
     cache_subdir = CACHE_DIR / cache_type
-    cache_subdir.mkdir(parents=True, exist_ok=True)
+    if cache_subdir not in _ENSURED_DIRS:
+        cache_subdir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(cache_subdir)
     cache_file = cache_subdir / f"{cache_key}.json"
 
+    # Write to a per-writer temp file and rename it into place so readers
+    # never see a half-written entry (threads may cache the same key at once)
+    tmp_file = cache_subdir / f"{cache_key}.{os.getpid()}.{threading.get_ident()}.tmp"
+    timestamp = time.time()
+
     try:
-        cache_file.write_text(json.dumps({
-            'timestamp': time.time(),
+        raw = _dumps({
+            'timestamp': timestamp,
             'identifier': identifier,
             'content': content
-        }, indent=2))
+        })
+        tmp_file.write_bytes(raw)
+        os.replace(tmp_file, cache_file)
+        _mem_put((cache_type, cache_key), timestamp, raw)
     except (OSError, TypeError) as e:
+        tmp_file.unlink(missing_ok=True)
         # Log but don't fail if caching fails
         print(f"Warning: Failed to cache {identifier}: {e}")
 
 
+def _list_cache_subdirs() -> List[os.DirEntry]:
+    """List cache type subdirectories with a single directory scan."""
+    with os.scandir(CACHE_DIR) as it:
+        return [entry for entry in it if entry.is_dir()]
+
+
+def _list_cache_files(cache_subdir: os.DirEntry, suffixes: Tuple[str, ...] = ('.json',)) -> List[os.DirEntry]:
+    """
+    List the cache files in a subdirectory (DirEntry avoids a Path per file).
+
+    Args:
+        cache_subdir: Cache type subdirectory
+        suffixes: File name endings to include
+
+    Returns:
+        Matching file entries
+    """
+    with os.scandir(cache_subdir.path) as it:
+        return [entry for entry in it if entry.name.endswith(suffixes) and entry.is_file()]
+
+
+def _unlink_quietly(path: str) -> bool:
+    """Remove a file, returning False instead of raising on failure."""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        # Already gone (expired and removed by a concurrent reader)
+        return True
+    except OSError:
+        return False
+
+
 def clear_cache() -> Dict[str, int]:
     """
     Clear all cached files.
@@ -120,21 +257,32 @@ def clear_cache() -> Dict[str, int]:
     Returns:
         Dict with counts: {'files_removed': N, 'errors': M}
     """
+    from concurrent.futures import ThreadPoolExecutor
+
     files_removed = 0
     errors = 0
 
+    with _MEM_LOCK:
+        _MEM.clear()
+    _ENSURED_DIRS.clear()
+
     if not CACHE_DIR.exists():
         return {'files_removed': 0, 'errors': 0}
 
-    # Iterate through all subdirectories
-    for cache_subdir in CACHE_DIR.iterdir():
-        if cache_subdir.is_dir():
-            for cache_file in cache_subdir.glob('*.json'):
-                try:
-                    cache_file.unlink()
-                    files_removed += 1
-                except OSError:
-                    errors += 1
+    paths = [
+        entry.path
+        for cache_subdir in _list_cache_subdirs()
+        # Includes temp files orphaned by a write interrupted before os.replace
+        for entry in _list_cache_files(cache_subdir, ('.json', '.tmp'))
+    ]
+
+    # Unlinks are syscall-latency bound, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=min(16, max(1, len(paths)))) as executor:
+        for removed in executor.map(_unlink_quietly, paths):
+            if removed:
+                files_removed += 1
+            else:
+                errors += 1
 
     return {'files_removed': files_removed, 'errors': errors}
 
@@ -163,17 +311,16 @@ def get_cache_stats() -> Dict[str, Any]:
         'cache_types': {}
     }
 
-    for cache_subdir in CACHE_DIR.iterdir():
-        if cache_subdir.is_dir():
-            subdir_files = list(cache_subdir.glob('*.json'))
-            subdir_size = sum(f.stat().st_size for f in subdir_files)
-
-            stats['cache_types'][cache_subdir.name] = {
-                'files': len(subdir_files),
-                'size_kb': round(subdir_size / 1024, 2)
-            }
-            stats['total_files'] += len(subdir_files)
-            stats['total_size_kb'] += subdir_size / 1024
+    for cache_subdir in _list_cache_subdirs():
+        subdir_files = _list_cache_files(cache_subdir)
+        subdir_size = sum(entry.stat().st_size for entry in subdir_files)
+
+        stats['cache_types'][cache_subdir.name] = {
+            'files': len(subdir_files),
+            'size_kb': round(subdir_size / 1024, 2)
+        }
+        stats['total_files'] += len(subdir_files)
+        stats['total_size_kb'] += subdir_size / 1024
 
     stats['total_size_kb'] = round(stats['total_size_kb'], 2)
     return stats
@@ -5,16 +5,24 @@ Loads and validates environment variables from .env file.
 Loads source configuration from config/sources.yaml.
 """
 
+import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 from dotenv import load_dotenv
-import yaml
 
 # Load environment variables
 load_dotenv()
 
 
+@lru_cache(maxsize=None)
+def _envint(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to default when unset."""
+    return int(os.environ.get(name, default))
+
+
 class Config:
     """Application configuration loaded from environment variables"""
 
@@ -31,13 +39,18 @@ class Config:
     # Location Preferences
     DEFAULT_CITY = os.getenv('DEFAULT_CITY', 'Washington')
     DEFAULT_STATE = os.getenv('DEFAULT_STATE', 'DC')
-    SEARCH_RADIUS_MILES = int(os.getenv('SEARCH_RADIUS_MILES', '10'))
+    SEARCH_RADIUS_MILES = _envint('SEARCH_RADIUS_MILES', 10)
+
+    # Restaurant Discovery
+    LOCATION_CITY = os.getenv('LOCATION_CITY', 'Washington DC')
+    TAVILY_API_KEY = os.getenv('TAVILY_API_KEY', '')
 
     # Reservation Preferences
     DAY_OF_WEEK = os.getenv('DAY_OF_WEEK', '[Friday, Saturday]')
+    DAYS_OF_WEEK = tuple(day.strip() for day in DAY_OF_WEEK.strip('[]').split(','))
     TIME_OF_DAY_START = os.getenv('TIME_OF_DAY_START', '5:30PM')
     TIME_OF_DAY_END = os.getenv('TIME_OF_DAY_END', '8:00PM')
-    PARTY_SIZE = int(os.getenv('PARTY_SIZE', '2'))
+    PARTY_SIZE = _envint('PARTY_SIZE', 2)
 
     # Google Sheets Configuration
     GOOGLE_SHEETS_SPREADSHEET_ID = os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID', '')
@@ -46,14 +59,20 @@ class Config:
     GOOGLE_SHEETS_SHEET_NAME = os.getenv('GOOGLE_SHEETS_SHEET_NAME', 'Date Night Restaurant List')
 
     # Project paths
-    PROJECT_ROOT = Path(__file__).parent.parent.parent
+    PROJECT_ROOT = Path(__file__).resolve().parents[2]
     DATA_DIR = PROJECT_ROOT / 'data'
     LOGS_DIR = PROJECT_ROOT / 'logs'
     CACHE_DIR = DATA_DIR / 'cache'
+    # Run-to-run bookkeeping kept outside CACHE_DIR, so cache stats and
+    # --clear-cache only ever see cached API responses
+    STATE_DIR = DATA_DIR / 'state'
 
     # Cache Configuration
     CACHE_ENABLED = os.getenv('DISABLE_CACHE', '').lower() != 'true'
-    CACHE_TTL_HOURS = int(os.getenv('CACHE_TTL_HOURS', '24'))
+    CACHE_TTL_HOURS = _envint('CACHE_TTL_HOURS', 24)
+
+    # Set once validate() has created the data directories
+    _dirs_ready = False
 
     @classmethod
     def validate(cls) -> List[str]:
@@ -71,85 +90,149 @@ class Config:
         if not Path(cls.GOOGLE_SHEETS_CREDENTIALS_FILE).exists():
             errors.append(f"Google credentials file not found: {cls.GOOGLE_SHEETS_CREDENTIALS_FILE}")
 
-        # Create directories if they don't exist
-        cls.DATA_DIR.mkdir(exist_ok=True)
-        cls.LOGS_DIR.mkdir(exist_ok=True)
-        cls.CACHE_DIR.mkdir(exist_ok=True)
+        # Create directories if they don't exist (once per process)
+        if not cls._dirs_ready:
+            for directory in (cls.DATA_DIR, cls.LOGS_DIR, cls.CACHE_DIR):
+                directory.mkdir(parents=True, exist_ok=True)
+            cls._dirs_ready = True
 
         return errors
 
     @classmethod
     def get_days_of_week(cls) -> List[str]:
         """
-        Parse DAY_OF_WEEK from config string.
+        Get the reservation days parsed from DAY_OF_WEEK.
 
         Returns:
             List of day names (e.g., ['Friday', 'Saturday'])
         """
-        days_str = cls.DAY_OF_WEEK.strip('[]')
-        return [day.strip() for day in days_str.split(',')]
+        return list(cls.DAYS_OF_WEEK)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
-# Cache for sources config to avoid repeated file reads
-_sources_config_cache: Dict[str, Any] = {}
+def _sources_snapshot_path() -> Path:
+    """Location of the parsed sources.yaml snapshot."""
+    return Config.STATE_DIR / 'sources.json'
 
 
-def load_sources_config() -> Dict[str, Any]:
+def _read_sources_snapshot(stamp: List[int]) -> Optional[Dict[str, Any]]:
+    """
+    Load the parsed sources config saved by a previous run.
+
+    Args:
+        stamp: [mtime_ns, size] of the current sources.yaml
+
+    Returns:
+        The saved config if it was parsed from this exact file version, else None
+    """
+    try:
+        snapshot = json.loads(_sources_snapshot_path().read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if snapshot.get('stamp') != stamp:
+        return None
+    return snapshot.get('config')
+
+
+def _write_sources_snapshot(stamp: List[int], config: Dict[str, Any]) -> None:
+    """Save the parsed sources config (temp file + rename, so readers never see a partial file)."""
+    snapshot_path = _sources_snapshot_path()
+    tmp_path = snapshot_path.with_name(f"sources.{os.getpid()}.tmp")
+
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps({'stamp': stamp, 'config': config}))
+        os.replace(tmp_path, snapshot_path)
+    except (OSError, TypeError):
+        # A missing snapshot only costs a YAML parse next time
+        tmp_path.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=1)
+def load_sources_config() -> Mapping[str, Any]:
     """
     Load restaurant source configuration from config/sources.yaml.
 
+    The file is read once per process; later calls return the same object.
+    The result is deep-frozen (read-only mappings, tuples instead of lists)
+    since every caller shares it.
+    The parsed result is also snapshotted under data/state/ and reused
+    by later runs until sources.yaml changes, which skips the YAML parse.
+
     Returns:
-        Dict containing:
-        - known_urls: Dict[str, List[str]] - source name -> list of URLs
-        - search_queries: Dict[str, List[str]] - source name -> list of queries
-        - source_domains: Dict[str, str] - source name -> domain
+        Read-only mapping containing:
+        - known_urls: source name -> tuple of URLs
+        - search_queries: source name -> tuple of queries
+        - source_domains: source name -> domain
 
     Raises:
         FileNotFoundError: If config/sources.yaml doesn't exist
         yaml.YAMLError: If YAML is invalid
     """
-    global _sources_config_cache
-
-    if _sources_config_cache:
-        return _sources_config_cache
-
     config_path = Config.PROJECT_ROOT / 'config' / 'sources.yaml'
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Sources config not found: {config_path}\n"
             "Please create config/sources.yaml with known_urls, search_queries, and source_domains."
-        )
+        ) from None
+
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    config = _read_sources_snapshot(stamp)
+    if config is not None:
+        return _freeze(config)
+
+    # Imported here so processes that never parse sources.yaml skip PyYAML
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it (same safety as SafeLoader)
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=loader) or {}
 
-    # Validate required keys
-    required_keys = ['known_urls', 'search_queries', 'source_domains']
+    # Validate required keys (missing sections become empty dicts so the
+    # section accessors below can index directly)
+    required_keys = ['known_urls', 'search_queries', 'source_domains', 'deep_crawl_sources']
     for key in required_keys:
-        if key not in config:
+        if not config.get(key):
             config[key] = {}
 
-    _sources_config_cache = config
-    return config
+    _write_sources_snapshot(stamp, config)
+    return _freeze(config)
 
 
-def get_known_urls() -> Dict[str, List[str]]:
+@lru_cache(maxsize=1)
+def get_known_urls() -> Mapping[str, tuple]:
     """Get known high-value URLs by source."""
-    return load_sources_config().get('known_urls', {})
+    return load_sources_config()['known_urls']
 
 
-def get_search_queries() -> Dict[str, List[str]]:
+@lru_cache(maxsize=1)
+def get_search_queries() -> Mapping[str, tuple]:
     """Get source-specific search queries."""
-    return load_sources_config().get('search_queries', {})
+    return load_sources_config()['search_queries']
 
 
-def get_source_domains() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def get_source_domains() -> Mapping[str, str]:
     """Get source domain mappings."""
-    return load_sources_config().get('source_domains', {})
+    return load_sources_config()['source_domains']
 
 
-def get_deep_crawl_sources() -> Dict[str, Dict[str, Any]]:
+@lru_cache(maxsize=1)
+def get_deep_crawl_sources() -> Mapping[str, Mapping[str, Any]]:
     """
     Get deep crawl source configurations.
 
@@ -159,4 +242,4 @@ def get_deep_crawl_sources() -> Dict[str, Dict[str, Any]]:
         - restaurant_url_pattern: Regex pattern to match restaurant pages
         - max_restaurants: Max number of restaurants to extract
     """
-    return load_sources_config().get('deep_crawl_sources', {})
+    return load_sources_config()['deep_crawl_sources']
@@ -4,18 +4,37 @@ Logging configuration for the Date Night Reservation Agent.
 Provides JSON-formatted logs as specified in PRD section 6.2.
 """
 
+import atexit
 import json
 import logging
-from datetime import datetime
-from pathlib import Path
+import logging.handlers
+import queue
+import time
 from typing import Any, Dict
 
+from utils.config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_json(data: Dict[str, Any]) -> str:
+    """Serialize a log record dict (orjson when available, else stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data)
+
 
 class JSONFormatter(logging.Formatter):
     """
     Custom formatter that outputs logs in JSON format.
     """
 
+    # Timestamps come from record.created, rendered in UTC
+    converter = time.gmtime
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -27,7 +46,7 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data: Dict[str, Any] = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}Z",
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -41,10 +60,32 @@ class JSONFormatter(logging.Formatter):
             log_data['exception'] = self.formatException(record.exc_info)
 
         # Add extra fields if present
-        if hasattr(record, 'extra_data'):
-            log_data['extra'] = record.extra_data
+        extra_data = record.__dict__.get('extra_data')
+        if extra_data is not None:
+            log_data['extra'] = extra_data
 
-        return json.dumps(log_data)
+        return _to_json(log_data)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+
+    The stock prepare() pre-formats the message and drops exc_info so records
+    can be pickled; here the record goes to a listener thread in the same
+    process unchanged, so JSONFormatter still sees the exception and args.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Set once the shared handlers are attached to the root logger
+_configured = False
+
+# Rotate logs/app.log at 10 MB, keeping three old files
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
 
 
 def setup_logger(
@@ -55,37 +96,59 @@ def setup_logger(
     """
     Set up a logger with JSON formatting.
 
+    The JSON file handler and console handler are created once and attached
+    to the root logger; named loggers only get a level and propagate to them,
+    so every module shares one open log file. File records are handed to a
+    background QueueListener thread, which does the JSON formatting and disk
+    writes off the caller's thread.
+
     Args:
         name: Logger name (typically __name__)
-        log_file: Log file name (saved in logs/ directory)
+        log_file: Log file name (saved in logs/ directory); only the first
+            call's value is used
         level: Logging level (default: INFO)
 
     Returns:
         Configured logger instance
     """
+    global _configured
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # Avoid duplicate handlers
-    if logger.handlers:
+    if _configured:
         return logger
 
+    root = logging.getLogger()
+
     # File handler with JSON formatting
-    log_path = Path(__file__).parent.parent.parent / 'logs' / log_file
+    log_path = Config.LOGS_DIR / log_file
     log_path.parent.mkdir(exist_ok=True)
 
-    file_handler = logging.FileHandler(log_path)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT
+    )
     file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
 
-    # Console handler with standard formatting
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    # Drain queued records before the interpreter exits
+    atexit.register(listener.stop)
+    root.addHandler(_LocalQueueHandler(log_queue))
+
+    # Console handler with standard formatting (kept synchronous so its
+    # output stays ordered with the CLI's print() output)
     console_handler = logging.StreamHandler()
     console_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    root.addHandler(console_handler)
 
+    _configured = True
     return logger
 
 
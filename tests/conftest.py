@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: make the src/ modules importable the same way main.py does.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
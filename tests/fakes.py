@@ -0,0 +1,67 @@
+"""
+Test doubles shared across test modules.
+"""
+
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Tuple
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+
+def http_error(status: int, headers: Dict[str, str] = None) -> HttpError:
+    """Build an HttpError with the given status and response headers."""
+    resp = httplib2.Response({'status': status, **(headers or {})})
+    return HttpError(resp=resp, content=b'{}')
+
+
+class FakeRequest:
+    """Unexecuted API request; execute() plays back the next queued outcome."""
+
+    def __init__(self, outcomes: deque):
+        self._outcomes = outcomes
+        self.executions = 0
+
+    def execute(self) -> Any:
+        self.executions += 1
+        outcome = self._outcomes.popleft() if self._outcomes else {}
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class FakeSheetsService:
+    """
+    Stand-in for the googleapiclient Sheets service.
+
+    service.spreadsheets().values().<method>(**kwargs) records (method, kwargs)
+    in calls and returns a FakeRequest. Outcomes queued with respond() are
+    returned (or raised, for exceptions) by successive executions of that
+    method; the default outcome is an empty dict.
+    """
+
+    def __init__(self):
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+        self._outcomes: Dict[str, deque] = defaultdict(deque)
+
+    def respond(self, method: str, *outcomes: Any) -> None:
+        self._outcomes[method].extend(outcomes)
+
+    def methods(self) -> List[str]:
+        return [method for method, _ in self.calls]
+
+    def spreadsheets(self) -> 'FakeSheetsService':
+        return self
+
+    def values(self) -> 'FakeSheetsService':
+        return self
+
+    def __getattr__(self, method: str):
+        if method.startswith('_'):
+            raise AttributeError(method)
+
+        def build_request(**kwargs) -> FakeRequest:
+            self.calls.append((method, kwargs))
+            return FakeRequest(self._outcomes[method])
+
+        return build_request
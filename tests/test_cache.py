@@ -0,0 +1,38 @@
+"""
+Tests for the file-based API response cache.
+"""
+
+import pytest
+
+from utils import cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory with a clean in-memory layer."""
+    monkeypatch.setattr(cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.delenv('DISABLE_CACHE', raising=False)
+    cache._refresh_env()
+    cache.clear_cache()
+    return tmp_path
+
+
+def test_round_trip_returns_fresh_copies():
+    cache.set_cached('query', {'results': [1]}, 'search')
+
+    first = cache.get_cached('query', 'search')
+    first['results'].append(2)
+
+    assert cache.get_cached('query', 'search') == {'results': [1]}
+
+
+def test_clear_cache_removes_orphaned_temp_files(cache_dir):
+    cache.set_cached('query', ['snippet'], 'search')
+    orphan = cache_dir / 'search' / 'deadbeef.123.456.tmp'
+    orphan.write_bytes(b'{"timestamp": 1')
+
+    result = cache.clear_cache()
+
+    assert result == {'files_removed': 2, 'errors': 0}
+    assert list((cache_dir / 'search').iterdir()) == []
+    assert cache.get_cached('query', 'search') is None
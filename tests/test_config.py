@@ -0,0 +1,87 @@
+"""
+Tests for the sources.yaml loader and its on-disk snapshot.
+"""
+
+import json
+import os
+
+import pytest
+
+from utils import config
+from utils.config import Config, load_sources_config
+
+SOURCES_YAML = """\
+known_urls:
+  eater_dc:
+    - https://dc.eater.com/maps/best-restaurants-washington-dc
+search_queries:
+  eater_dc:
+    - best restaurants dc
+source_domains:
+  eater_dc: dc.eater.com
+"""
+
+
+@pytest.fixture
+def sources_yaml(tmp_path, monkeypatch):
+    """Point Config at a temporary project root holding config/sources.yaml."""
+    monkeypatch.setattr(Config, 'PROJECT_ROOT', tmp_path)
+    monkeypatch.setattr(Config, 'STATE_DIR', tmp_path / 'data' / 'state')
+    path = tmp_path / 'config' / 'sources.yaml'
+    path.parent.mkdir()
+    path.write_text(SOURCES_YAML)
+
+    load_sources_config.cache_clear()
+    yield path
+    load_sources_config.cache_clear()
+
+
+def reload_sources():
+    load_sources_config.cache_clear()
+    return load_sources_config()
+
+
+def rewrite_snapshot_domain(domain):
+    """Edit the saved snapshot, so a reload shows whether it was reused."""
+    snapshot_path = config._sources_snapshot_path()
+    snapshot = json.loads(snapshot_path.read_text())
+    snapshot['config']['source_domains']['eater_dc'] = domain
+    snapshot_path.write_text(json.dumps(snapshot))
+
+
+def test_snapshot_is_reused_while_sources_yaml_is_unchanged(sources_yaml):
+    assert load_sources_config()['source_domains']['eater_dc'] == 'dc.eater.com'
+    assert Config.CACHE_DIR not in config._sources_snapshot_path().parents
+
+    rewrite_snapshot_domain('from-snapshot')
+
+    assert reload_sources()['source_domains']['eater_dc'] == 'from-snapshot'
+
+
+def test_snapshot_is_invalidated_when_size_changes(sources_yaml):
+    load_sources_config()
+    rewrite_snapshot_domain('from-snapshot')
+
+    sources_yaml.write_text(SOURCES_YAML.replace('dc.eater.com', 'eater.com/dc'))
+
+    assert reload_sources()['source_domains']['eater_dc'] == 'eater.com/dc'
+
+
+def test_snapshot_is_invalidated_when_mtime_changes(sources_yaml):
+    load_sources_config()
+    rewrite_snapshot_domain('from-snapshot')
+
+    stat = sources_yaml.stat()
+    os.utime(sources_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert reload_sources()['source_domains']['eater_dc'] == 'dc.eater.com'
+
+
+def test_loaded_config_is_read_only(sources_yaml):
+    sources = load_sources_config()
+
+    with pytest.raises(TypeError):
+        sources['source_domains']['eater_dc'] = 'elsewhere'
+    with pytest.raises(TypeError):
+        sources['known_urls'] = {}
+    assert isinstance(sources['search_queries']['eater_dc'], tuple)
@@ -0,0 +1,46 @@
+"""
+Tests for fuzzy restaurant deduplication.
+"""
+
+from agents.restaurant_list_agent import deduplicate_restaurants
+from models.restaurant import create_restaurant
+
+
+def _names(restaurants):
+    return [restaurant['name'] for restaurant in restaurants]
+
+
+def test_merges_name_variants():
+    restaurants = [
+        create_restaurant("Imperfecto"),
+        create_restaurant("Imperfecto: The Chef's Table"),
+        create_restaurant("Sushi Nakazawa"),
+        create_restaurant("Sushi Nakazawa Washington DC"),
+    ]
+
+    assert _names(deduplicate_restaurants(restaurants)) == ["Imperfecto", "Sushi Nakazawa"]
+
+
+def test_short_bridge_names_do_not_chain_distinct_restaurants():
+    # "Roses" and "Bar" fuzzy-match several names each, but those names don't
+    # match one another, so they must survive as separate restaurants
+    restaurants = [
+        create_restaurant(name)
+        for name in ["Rose's Luxury", "Rose's at Home", "Roses", "Bar Chinois", "Bar Spero", "Bar"]
+    ]
+
+    names = _names(deduplicate_restaurants(restaurants))
+
+    for distinct in ["Rose's Luxury", "Rose's at Home", "Bar Chinois", "Bar Spero"]:
+        assert distinct in names
+
+
+def test_merge_keeps_first_and_fills_missing_fields():
+    first = create_restaurant("Kinship", description="Short.")
+    duplicate = create_restaurant("kinship", description="A longer description.", price_range="$$$$")
+
+    (merged,) = deduplicate_restaurants([first, duplicate])
+
+    assert merged is first
+    assert merged['description'] == "A longer description."
+    assert merged['price_range'] == "$$$$"
@@ -0,0 +1,54 @@
+"""
+Tests for the edit-command fast path.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import agents.restaurant_list_agent as agent
+from agents.restaurant_list_agent import build_name_index, llm_parse_edit_command
+from models.restaurant import create_restaurant
+
+LLM_RESULT = {"action": "remove", "restaurant_name": "from llm", "field": None, "new_value": None}
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    """Replace the OpenAI client with a fake that records prompts and returns LLM_RESULT."""
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs['messages'][-1]['content'])
+        message = SimpleNamespace(content=json.dumps(LLM_RESULT))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(agent, 'get_openai_client', lambda: client)
+    return calls
+
+
+@pytest.fixture
+def name_index():
+    return build_name_index([create_restaurant("Kinship"), create_restaurant("Bresca")])
+
+
+@pytest.mark.parametrize("message", ["Remove Kinship", "delete kinship from my list.", "Drop 'Kinship'"])
+def test_known_name_uses_fast_path(message, name_index, llm_calls):
+    result = llm_parse_edit_command(message, name_index)
+
+    assert result['action'] == "remove"
+    assert result['restaurant_name'].lower() == "kinship"
+    assert llm_calls == []
+
+
+@pytest.mark.parametrize("message", [
+    "Remove Kinship, it closed",
+    "Delete Kinship and Bresca from my list",
+    "Remove Kinship from list",
+    "remove the restaurant called Kinship",
+])
+def test_unresolved_capture_falls_back_to_llm(message, name_index, llm_calls):
+    assert llm_parse_edit_command(message, name_index) == LLM_RESULT
+    assert len(llm_calls) == 1
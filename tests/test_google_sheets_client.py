@@ -0,0 +1,188 @@
+"""
+Tests for GoogleSheetsClient against a fake Sheets service.
+"""
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from clients import google_sheets_client
+from clients.google_sheets_client import GoogleSheetsClient
+from models.restaurant import create_restaurant
+from utils.config import Config
+from tests.fakes import FakeSheetsService, http_error
+
+
+@pytest.fixture
+def service():
+    return FakeSheetsService()
+
+
+@pytest.fixture
+def client(service, monkeypatch):
+    """GoogleSheetsClient wired to the fake service, skipping OAuth."""
+    monkeypatch.setenv('GOOGLE_SHEETS_SPREADSHEET_ID', 'sheet-id')
+    monkeypatch.setenv('GOOGLE_SHEETS_SHEET_NAME', 'List')
+    monkeypatch.setattr(google_sheets_client.time, 'sleep', lambda seconds: None)
+
+    def fake_authenticate(self):
+        self.service = service
+
+    monkeypatch.setattr(GoogleSheetsClient, '_authenticate', fake_authenticate)
+    return GoogleSheetsClient()
+
+
+def test_batched_appends_queued_rows_once_on_clean_exit(client, service):
+    with client.batched():
+        client.add_restaurant(create_restaurant("Kinship", date_added="2024-01-01"))
+        client.add_restaurant(create_restaurant("Bresca", date_added="2024-01-01"))
+        assert service.calls == []
+
+    assert service.methods() == ['append']
+    rows = service.calls[0][1]['body']['values']
+    assert [row[0] for row in rows] == ["Kinship", "Bresca"]
+    assert client._pending_rows == []
+
+
+def test_batched_drops_queued_rows_when_body_raises(client, service):
+    with pytest.raises(RuntimeError):
+        with client.batched():
+            client.add_restaurant(create_restaurant("Kinship"))
+            raise RuntimeError("boom")
+
+    assert service.calls == []
+    assert client._pending_rows == []
+
+
+def test_batched_surfaces_failed_auto_flush_without_retrying_on_exit(client, service, monkeypatch):
+    monkeypatch.setattr(GoogleSheetsClient, 'BATCH_SIZE', 2)
+    error = http_error(400)
+    service.respond('append', error)
+
+    with pytest.raises(type(error)) as raised:
+        with client.batched():
+            client.add_restaurant(create_restaurant("Kinship"))
+            client.add_restaurant(create_restaurant("Bresca"))
+
+    assert raised.value is error
+    assert service.methods() == ['append']
+    assert client._pending_rows == []
+
+
+def test_get_all_restaurants_returns_copies_of_cached_rows(client, service):
+    service.respond('get', {'values': [["Kinship", "", "", "", "$$$"]]})
+
+    first = client.get_all_restaurants()
+    first[0]['price_range'] = "$"
+
+    assert client.get_all_restaurants()[0]['price_range'] == "$$$"
+    assert service.methods() == ['get']
+
+
+class TestExecuteWithRetry:
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        slept = []
+        monkeypatch.setattr(google_sheets_client.time, 'sleep', slept.append)
+        monkeypatch.setattr(google_sheets_client.random, 'random', lambda: 0.0)
+        return slept
+
+    def test_waits_for_retry_after_then_succeeds(self, service, sleeps):
+        service.respond('get', http_error(429, {'retry-after': '7'}), {'values': []})
+        request = service.spreadsheets().values().get(range='A1')
+
+        assert google_sheets_client._execute_with_retry(request) == {'values': []}
+        assert sleeps == [7.0]
+
+    @pytest.mark.parametrize('status', [500, 502, 503, 504])
+    def test_backs_off_exponentially_on_server_errors(self, service, sleeps, status):
+        service.respond('get', http_error(status), http_error(status), {})
+        request = service.spreadsheets().values().get(range='A1')
+
+        google_sheets_client._execute_with_retry(request, base_delay=1.0)
+        assert sleeps == [1.0, 2.0]
+
+    def test_gives_up_after_max_attempts(self, service, sleeps):
+        service.respond('get', *[http_error(503) for _ in range(3)])
+        request = service.spreadsheets().values().get(range='A1')
+
+        with pytest.raises(HttpError):
+            google_sheets_client._execute_with_retry(request, max_attempts=3)
+        assert request.executions == 3
+        assert len(sleeps) == 2
+
+    def test_client_errors_are_not_retried(self, service, sleeps):
+        service.respond('get', http_error(404))
+        request = service.spreadsheets().values().get(range='A1')
+
+        with pytest.raises(HttpError):
+            google_sheets_client._execute_with_retry(request)
+        assert request.executions == 1
+        assert sleeps == []
+
+
+def test_init_marker_lives_outside_the_response_cache(client):
+    marker = client._init_marker_path()
+
+    assert Config.STATE_DIR in marker.parents
+    assert Config.CACHE_DIR not in marker.parents
+
+
+def test_prime_sheet_reads_header_and_rows_in_one_batch_get(client, service):
+    service.respond('batchGet', {'valueRanges': [
+        {'range': 'List!A1:M1', 'values': [GoogleSheetsClient.HEADER_ROW]},
+        {'range': 'List!A2:M1000', 'values': [["Kinship", "", "", "", "$$$$", "", "4.5"]]},
+    ]})
+
+    assert client._prime_sheet() == GoogleSheetsClient.HEADER_ROW
+    assert service.calls[0][1]['ranges'] == ['List!A1:M1', 'List!A2:M']
+
+    restaurants = client.get_all_restaurants()
+    assert restaurants[0]['name'] == "Kinship"
+    assert restaurants[0]['eater_dc_rank'] == 4.5
+    assert restaurants[0]['priority_rank'] == 0.0
+    assert service.methods() == ['batchGet']
+
+
+def test_update_restaurant_sends_one_range_with_gaps_left_unset(client, service):
+    service.respond('update', {'updatedCells': 2})
+
+    assert client.update_restaurant(3, {'price_range': "$$", 'eater_dc_rank': 4.0, 'unknown': "x"})
+
+    assert service.methods() == ['update']
+    request = service.calls[0][1]
+    assert request['range'] == 'List!E3:G3'
+    assert request['body'] == {'values': [["$$", None, 4.0]]}
+
+
+def test_update_restaurant_without_known_fields_makes_no_request(client, service):
+    assert client.update_restaurant(3, {'unknown': "x"})
+    assert service.calls == []
+
+
+def test_update_restaurants_sends_one_batch_update_and_invalidates_cache(client, service):
+    service.respond('get', {'values': [["Kinship"]]}, {'values': [["Kinship", "", "", "", "$$"]]})
+    client.get_all_restaurants()
+
+    assert client.update_restaurants({
+        2: {'price_range': "$$"},
+        5: {'name': "Bresca", 'cuisine_type': "American"},
+        7: {'unknown': "x"},
+    })
+
+    assert service.methods() == ['get', 'batchUpdate']
+    body = service.calls[1][1]['body']
+    assert body['valueInputOption'] == 'USER_ENTERED'
+    assert body['data'] == [
+        {'range': 'List!E2:E2', 'values': [["$$"]]},
+        {'range': 'List!A5:F5', 'values': [["Bresca", None, None, None, None, "American"]]},
+    ]
+
+    assert client.get_all_restaurants()[0]['price_range'] == "$$"
+    assert service.methods() == ['get', 'batchUpdate', 'get']
+
+
+def test_update_restaurants_rejects_the_header_row(client, service):
+    with pytest.raises(ValueError):
+        client.update_restaurants({1: {'name': "Header"}})
+    assert service.calls == []
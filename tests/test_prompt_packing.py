@@ -0,0 +1,68 @@
+"""
+Tests for splitting page content and packing prompt batches.
+"""
+
+import random
+
+import pytest
+
+from agents.restaurant_list_agent import _pack_prompts, split_content_chunks
+
+
+class TestSplitContentChunks:
+
+    def test_content_that_fits_is_returned_whole(self):
+        assert split_content_chunks("short page", 100) == ["short page"]
+
+    def test_breaks_between_paragraphs(self):
+        paragraphs = ["a" * 40, "b" * 40, "c" * 40]
+
+        chunks = split_content_chunks('\n\n'.join(paragraphs), 90)
+
+        assert chunks == ['\n\n'.join(paragraphs[:2]), paragraphs[2]]
+
+    def test_oversize_paragraph_is_hard_split(self):
+        chunks = split_content_chunks("x" * 250 + "\n\nend", 100)
+
+        assert chunks == ["x" * 100, "x" * 100, "x" * 50 + "\n\nend"]
+
+    def test_chunks_respect_the_limit_and_keep_all_text(self):
+        rng = random.Random(7)
+        paragraphs = ["p" * rng.randint(1, 180) for _ in range(50)]
+        content = '\n\n'.join(paragraphs)
+
+        chunks = split_content_chunks(content, 120)
+
+        assert all(len(chunk) <= 120 for chunk in chunks)
+        assert '\n\n'.join(chunks).replace('\n', '') == content.replace('\n', '')
+
+
+class TestPackPrompts:
+
+    def test_batches_stay_under_the_token_budget(self):
+        rng = random.Random(11)
+        sizes = [rng.randint(1, 400) for _ in range(200)]
+        items = list(range(len(sizes)))
+
+        batches = _pack_prompts(items, sizes, token_budget=1000, max_items=10)
+
+        assert sorted(item for batch in batches for item in batch) == items
+        for batch in batches:
+            assert len(batch) <= 10
+            assert sum(sizes[item] for item in batch) <= 1000
+
+    def test_packs_first_fit_decreasing(self):
+        batches = _pack_prompts(['a', 'b', 'c', 'd'], [60, 50, 40, 30], token_budget=100, max_items=5)
+
+        assert batches == [['a', 'c'], ['b', 'd']]
+
+    @pytest.mark.parametrize('max_items', [1, 3])
+    def test_max_items_caps_each_batch(self, max_items):
+        batches = _pack_prompts(list('abcdef'), [1] * 6, token_budget=1000, max_items=max_items)
+
+        assert [len(batch) for batch in batches] == [max_items] * (6 // max_items)
+
+    def test_item_over_budget_gets_its_own_batch(self):
+        batches = _pack_prompts(['huge', 'small'], [500, 10], token_budget=100, max_items=5)
+
+        assert batches == [['huge'], ['small']]
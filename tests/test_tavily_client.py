@@ -0,0 +1,71 @@
+"""
+Tests for the Tavily rate limiter.
+"""
+
+import pytest
+
+from clients import tavily_client
+from clients.tavily_client import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; time.sleep advances it instead of blocking."""
+
+    class Clock:
+        def __init__(self):
+            self.now = 100.0
+            self.sleeps = []
+
+        def monotonic(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+    fake = Clock()
+    monkeypatch.setattr(tavily_client.time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(tavily_client.time, 'sleep', fake.sleep)
+    return fake
+
+
+def test_burst_is_available_without_waiting(clock):
+    bucket = TokenBucket(rate=2.0, burst=3)
+
+    for _ in range(3):
+        bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_empty_bucket_waits_for_one_token_at_rate(clock):
+    bucket = TokenBucket(rate=2.0, burst=1)
+    bucket.acquire()
+
+    bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.5)]
+    assert clock.now == pytest.approx(100.5)
+
+
+def test_refill_is_capped_at_burst(clock):
+    bucket = TokenBucket(rate=2.0, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+    for _ in range(3):
+        bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_partial_refill_shortens_the_wait(clock):
+    bucket = TokenBucket(rate=4.0, burst=1)
+    bucket.acquire()
+
+    clock.now += 0.125
+    bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.125)]
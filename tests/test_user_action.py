@@ -0,0 +1,29 @@
+"""
+Tests for routing user messages to an action in initiate_discovery.
+"""
+
+import pytest
+
+from agents.restaurant_list_agent import initiate_discovery
+
+
+def _route(message: str) -> str:
+    return initiate_discovery({"user_message": message})['user_action']
+
+
+@pytest.mark.parametrize("message, action", [
+    ("Find new restaurants", "discover"),
+    ("Have you found anything?", "discover"),
+    ("Searching for spots", "discover"),
+    ("Keep my list updated", "discover"),
+    ("Updating the list", "discover"),
+    ("Remove Kinship", "edit"),
+    ("Removing Kinship please", "edit"),
+    ("Deleting Bresca", "edit"),
+    ("Changing a restaurant", "edit"),
+    ("Show me my current list", "view"),
+    ("Listing please", "view"),
+    ("Give me an overview of the renewal", "discover"),
+])
+def test_routes_keyword_inflections(message, action):
+    assert _route(message) == action